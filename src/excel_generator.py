@@ -2,18 +2,31 @@ import pandas as pd
 import openpyxl
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.chart import BarChart, PieChart, Reference
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.utils import get_column_letter
 import numpy as np
 from datetime import datetime, timedelta
 import random
+import math
+from contextlib import nullcontext
 
 class GHGExcelGenerator:
-    def __init__(self):
+    # Header styles, built once and shared by every sheet
+    HEADER_FONT = Font(bold=True, color='FFFFFF')
+    HEADER_FILL = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+    HEADER_BORDER = Border(left=Side(style='thin'), right=Side(style='thin'),
+                           top=Side(style='thin'), bottom=Side(style='thin'))
+    HEADER_ALIGNMENT = Alignment(horizontal='center')
+
+    def __init__(self, **company_info):
         self.company_info = {
             'name': 'PetrolCorp International',
             'reporting_year': 2024,
             'report_date': datetime.now().strftime('%Y-%m-%d'),
             'facilities': ['Refinery A', 'Refinery B', 'Offshore Platform C', 'Distribution Center D']
         }
+        # Keyword arguments override the default company details
+        self.company_info.update(company_info)
 
     def generate_dummy_data(self):
         """Generate comprehensive dummy GHG data for petroleum company"""
@@ -75,9 +88,9 @@ class GHGExcelGenerator:
             })
 
         # Calculate percentages
-        total_scope1 = sum([row['Annual_Total'] for row in scope1_data])
-        total_scope2 = sum([row['Annual_Total'] for row in scope2_data])
-        total_scope3 = sum([row['Annual_Total'] for row in scope3_data])
+        total_scope1 = math.fsum(row['Annual_Total'] for row in scope1_data)
+        total_scope2 = math.fsum(row['Annual_Total'] for row in scope2_data)
+        total_scope3 = math.fsum(row['Annual_Total'] for row in scope3_data)
         grand_total = total_scope1 + total_scope2 + total_scope3
 
         for row in scope1_data:
@@ -135,12 +148,46 @@ class GHGExcelGenerator:
         }
 
     def create_excel_template(self, filename='ghg_report_template.xlsx'):
-        """Create comprehensive Excel template with multiple sheets"""
+        """Create comprehensive Excel template with multiple sheets
+
+        Args:
+            filename: Output path, or a writable binary file-like object (e.g. io.BytesIO)
+        """
         data = self.generate_dummy_data()
 
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+        # Open the target first so a bad path fails before any sheet is written;
+        # a 1 MiB buffer batches the zip writer's many small writes
+        with (nullcontext(filename) if hasattr(filename, 'write')
+              else open(filename, 'wb', buffering=1 << 20)) as output:
+            self._write_template(output, data)
+        return filename
+
+    def to_frames(self, data=None):
+        """Build the template sheets as DataFrames without writing an xlsx
+
+        Args:
+            data: Output of generate_dummy_data(), or None to generate it
+
+        Returns:
+            Dict of sheet name -> DataFrame shaped like
+            pd.read_excel(template, sheet_name=None), for
+            GHGReportGenerator.from_frames
+        """
+        if data is None:
+            data = self.generate_dummy_data()
+
+        frames = {}
+        for sheet_name, rows in self._template_sheets(data).items():
+            df = pd.DataFrame(rows[1:], columns=rows[0]) if rows else pd.DataFrame()
+            # Same label dtypes GHGReportGenerator requests from read_excel
+            frames[sheet_name] = df.astype({col: 'string' for col in ('Source', 'Facility') if col in df.columns})
+        return frames
+
+    def _template_sheets(self, data):
+        """Rows for each template sheet, header row first"""
+        sheets = {
             # Dashboard/Summary Sheet
-            summary_data = pd.DataFrame([
+            'Dashboard': [
                 ['Company Name', self.company_info['name']],
                 ['Reporting Year', self.company_info['reporting_year']],
                 ['Report Date', self.company_info['report_date']],
@@ -149,87 +196,79 @@ class GHGExcelGenerator:
                 ['Scope 2 Emissions (tCO2e)', f"{data['totals']['scope2_total']:.2f}"],
                 ['Scope 3 Emissions (tCO2e)', f"{data['totals']['scope3_total']:.2f}"],
                 ['Total Facilities', len(self.company_info['facilities'])],
-                ['Carbon Intensity (tCO2e/barrel)', f"{data['totals']['grand_total']/sum([f['Production'] for f in data['facilities']]):.4f}"]
-            ])
-            summary_data.to_excel(writer, sheet_name='Dashboard', index=False, header=False)
-
-            # Scope 1 Emissions
-            df_scope1 = pd.DataFrame(data['scope1'])
-            df_scope1.to_excel(writer, sheet_name='Scope 1 Emissions', index=False)
-
-            # Scope 2 Emissions
-            df_scope2 = pd.DataFrame(data['scope2'])
-            df_scope2.to_excel(writer, sheet_name='Scope 2 Emissions', index=False)
+                ['Carbon Intensity (tCO2e/barrel)', f"{data['totals']['grand_total']/math.fsum(f['Production'] for f in data['facilities']):.4f}"]
+            ],
 
-            # Scope 3 Emissions
-            df_scope3 = pd.DataFrame(data['scope3'])
-            df_scope3.to_excel(writer, sheet_name='Scope 3 Emissions', index=False)
-
-            # Emission By Source
-            df_emission_by_source = pd.DataFrame(data['emission_by_source'])
-            df_emission_by_source.to_excel(writer, sheet_name='Emission By Source', index=False)
-
-            # Facility Breakdown
-            df_facilities = pd.DataFrame(data['facilities'])
-            df_facilities.to_excel(writer, sheet_name='Facility Breakdown', index=False)
+            # Scope 1/2/3 Emissions, Emission By Source and Facility Breakdown
+            'Scope 1 Emissions': self._records_to_rows(data['scope1']),
+            'Scope 2 Emissions': self._records_to_rows(data['scope2']),
+            'Scope 3 Emissions': self._records_to_rows(data['scope3']),
+            'Emission By Source': self._records_to_rows(data['emission_by_source']),
+            'Facility Breakdown': self._records_to_rows(data['facilities']),
 
             # Targets and Performance
-            targets_data = pd.DataFrame([
+            'Targets & Performance': self._records_to_rows([
                 {'Metric': 'Total GHG Reduction Target (%)', 'Target_2024': 5, 'Actual_2024': 3.2, 'Target_2025': 10, 'Status': 'On Track'},
                 {'Metric': 'Scope 1 Reduction (%)', 'Target_2024': 3, 'Actual_2024': 2.1, 'Target_2025': 7, 'Status': 'Needs Improvement'},
                 {'Metric': 'Energy Intensity Reduction (%)', 'Target_2024': 4, 'Actual_2024': 4.5, 'Target_2025': 8, 'Status': 'Exceeded'},
                 {'Metric': 'Renewable Energy Usage (%)', 'Target_2024': 15, 'Actual_2024': 12, 'Target_2025': 25, 'Status': 'On Track'},
                 {'Metric': 'Carbon Capture Implementation', 'Target_2024': 2, 'Actual_2024': 1, 'Target_2025': 4, 'Status': 'Delayed'}
-            ])
-            targets_data.to_excel(writer, sheet_name='Targets & Performance', index=False)
+            ]),
 
             # Custom Text Sheet
-            custom_text_data = pd.DataFrame([
+            'Custom Text': [
                 ['Field', 'Content'],
                 ['Company Introduction', 'Example: Company A is specialized in refining operations. It has been established since 1995 and operates multiple facilities across the region...'],
                 ['Conclusion', 'Example: The company is committed to reducing emissions by 30% by 2030. Further investments in renewable energy and carbon capture technologies are planned...']
-            ])
-            custom_text_data.to_excel(writer, sheet_name='Custom Text', index=False, header=False)
+            ]
+        }
+        return sheets
 
-        # Format the Excel file
-        self._format_excel_file(filename)
-        return filename
+    def _write_template(self, output, data):
+        """Write the template sheets for data to an open binary output"""
+        # Single write-only pass: rows are streamed in order and formatting is
+        # applied as they are written, so the workbook is never reloaded
+        wb = openpyxl.Workbook(write_only=True)
+        for sheet_name, rows in self._template_sheets(data).items():
+            self._write_sheet(wb, sheet_name, rows)
+        wb.save(output)
+
+    def _records_to_rows(self, records):
+        """Header row plus value rows for a list of same-keyed dicts"""
+        if not records:
+            return []
+        return [list(records[0].keys())] + [list(record.values()) for record in records]
+
+    def _write_sheet(self, wb, sheet_name, rows):
+        """Append rows to a new write-only sheet, styling the first row as a header
+
+        Write-only sheets must be filled strictly top to bottom, so column
+        widths are computed from the rows up front and set before appending.
+        """
+        ws = wb.create_sheet(sheet_name)
+
+        # Auto-adjust column widths
+        num_columns = max((len(row) for row in rows), default=0)
+        for col_idx in range(num_columns):
+            max_length = max(len(str(row[col_idx] if col_idx < len(row) else None)) for row in rows)
+            ws.column_dimensions[get_column_letter(col_idx + 1)].width = min(max_length + 2, 50)
+
+        if not rows:
+            return
+
+        # Format headers
+        header_cells = []
+        for value in rows[0]:
+            cell = WriteOnlyCell(ws, value=value)
+            cell.font = self.HEADER_FONT
+            cell.fill = self.HEADER_FILL
+            cell.border = self.HEADER_BORDER
+            cell.alignment = self.HEADER_ALIGNMENT
+            header_cells.append(cell)
+        ws.append(header_cells)
 
-    def _format_excel_file(self, filename):
-        """Apply formatting to the Excel file"""
-        wb = openpyxl.load_workbook(filename)
-
-        # Define styles
-        header_font = Font(bold=True, color='FFFFFF')
-        header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
-        border = Border(left=Side(style='thin'), right=Side(style='thin'),
-                       top=Side(style='thin'), bottom=Side(style='thin'))
-
-        for sheet_name in wb.sheetnames:
-            ws = wb[sheet_name]
-
-            # Auto-adjust column widths
-            for column in ws.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
-
-            # Format headers
-            if ws.max_row > 0:
-                for cell in ws[1]:
-                    cell.font = header_font
-                    cell.fill = header_fill
-                    cell.border = border
-                    cell.alignment = Alignment(horizontal='center')
-
-        wb.save(filename)
+        for row in rows[1:]:
+            ws.append(row)
 
 if __name__ == "__main__":
     generator = GHGExcelGenerator()
@@ -4,12 +4,70 @@ from jinja2 import Template
 import json
 import base64
 import os
+import threading
 from datetime import datetime
 from report_generator import GHGReportGenerator
 
+# Static chart exports share one persistent Kaleido (Chromium) process.
+# Its sync server hands results back through a single queue, so calls
+# from concurrent report threads are serialised.
+_KALEIDO_LOCK = threading.Lock()
+_kaleido_server_started = False  # start_sync_server is only ever tried once
+_kaleido_server_stopped = False
+
+def _kaleido_server_alive(kaleido):
+    """True if Kaleido's sync server worker thread can be seen running
+
+    Kaleido exposes no public liveness check, so this looks at the server's
+    worker thread; if that attribute cannot be found the server is treated
+    as dead rather than risk blocking on its queue.
+    """
+    server = getattr(kaleido, '_global_server', None)
+    thread = getattr(server, '_thread', None)
+    return thread is not None and thread.is_alive()
+
+def _fig_to_png(fig, **kwargs):
+    """fig.to_image(format='png') through a persistent Kaleido browser
+
+    The first export runs one-shot, which proves Chromium can start; the
+    sync server (kaleido >= 1.1) is then started once so later exports reuse
+    its browser. If the server's worker dies it is stopped for good and
+    exports fall back to one-shot instead of blocking on its queue.
+    """
+    global _kaleido_server_started, _kaleido_server_stopped
+    with _KALEIDO_LOCK:
+        try:
+            import kaleido
+        except ImportError:
+            kaleido = None  # fig.to_image reports the missing package itself
+
+        if (_kaleido_server_started and not _kaleido_server_stopped
+                and not _kaleido_server_alive(kaleido)):
+            kaleido.stop_sync_server(silence_warnings=True)
+            _kaleido_server_stopped = True
+
+        img_bytes = fig.to_image(format="png", **kwargs)
+
+        if not _kaleido_server_started and hasattr(kaleido, 'start_sync_server'):
+            _kaleido_server_started = True
+            kaleido.start_sync_server(silence_warnings=True)
+        return img_bytes
+
 class HTMLReportGenerator:
-    def __init__(self, report_generator):
+    def __init__(self, report_generator, cache_charts=False):
+        """
+        Args:
+            report_generator: GHGReportGenerator holding the dataset
+            cache_charts: If True, keep the rendered charts per
+                (facility_filter, static) so repeated reports, and the PDF
+                generator sharing this instance, reuse the same figures and
+                Kaleido images. Only for datasets that are not modified.
+        """
         self.report_gen = report_generator
+        self._chart_cache = {} if cache_charts else None
+        # A cached instance is shared by concurrent HTML/PDF renders; the
+        # figures are built once under this lock
+        self._figures_lock = threading.Lock()
 
     def _get_logo_base64(self):
         """Convert logo to base64 for embedding in HTML"""
@@ -28,41 +86,54 @@ class HTMLReportGenerator:
             print(f"Error loading logo: {e}")
         return None
 
+    def render_to_string(self, facility_filter=None, use_ai=False, pdf_mode=False):
+        """Render the report and return the HTML as a string
+
+        Args:
+            facility_filter: Optional facility name to filter data
+            use_ai: If True, use AI-generated recommendations
+            pdf_mode: If True, use static images instead of interactive charts (for PDF)
+        """
+        # Get all charts and data with facility filtering
+        charts = self._generate_all_charts(facility_filter, static=pdf_mode)
+        recommendations = self.report_gen.generate_recommendations(use_ai=use_ai)
+        summary_stats = self.report_gen.get_summary_statistics(facility_filter)
+        logo_base64 = self._get_logo_base64()
+        custom_text = self.report_gen.get_custom_text()
+
+        # Create HTML template
+        html_template = self._create_html_template()
+
+        # Render template with data
+        template = Template(html_template)
+        return template.render(
+            charts=charts,
+            recommendations=recommendations,
+            summary_stats=summary_stats,
+            logo_base64=logo_base64,
+            custom_text=custom_text,
+            pdf_mode=pdf_mode,
+            report_date=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        )
+
     def generate_html_report(self, output_path, facility_filter=None, use_ai=False, pdf_mode=False):
         """Generate interactive HTML report
 
         Args:
-            output_path: Path to save HTML file
+            output_path: Path to save HTML file, or a writable text file-like object
             facility_filter: Optional facility name to filter data
             use_ai: If True, use AI-generated recommendations
             pdf_mode: If True, use static images instead of interactive charts (for PDF)
         """
         try:
-            # Get all charts and data with facility filtering
-            charts = self._generate_all_charts(facility_filter, static=pdf_mode)
-            recommendations = self.report_gen.generate_recommendations(use_ai=use_ai)
-            summary_stats = self.report_gen.get_summary_statistics(facility_filter)
-            logo_base64 = self._get_logo_base64()
-            custom_text = self.report_gen.get_custom_text()
-
-            # Create HTML template
-            html_template = self._create_html_template()
-
-            # Render template with data
-            template = Template(html_template)
-            html_content = template.render(
-                charts=charts,
-                recommendations=recommendations,
-                summary_stats=summary_stats,
-                logo_base64=logo_base64,
-                custom_text=custom_text,
-                pdf_mode=pdf_mode,
-                report_date=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            )
-
-            # Write to file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            html_content = self.render_to_string(facility_filter, use_ai=use_ai, pdf_mode=pdf_mode)
+
+            # Write to file (or straight into the caller's buffer)
+            if hasattr(output_path, 'write'):
+                output_path.write(html_content)
+            else:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    f.write(html_content)
 
             return True
         except Exception as e:
@@ -73,7 +144,7 @@ class HTMLReportGenerator:
         """Convert Plotly figure to base64 PNG image using Kaleido"""
         try:
             # Convert to PNG bytes using Kaleido
-            img_bytes = fig.to_image(format="png", width=width, height=height, scale=2)
+            img_bytes = _fig_to_png(fig, width=width, height=height, scale=2)
             # Encode to base64
             img_base64 = base64.b64encode(img_bytes).decode('utf-8')
             return f'data:image/png;base64,{img_base64}'
@@ -88,53 +159,59 @@ class HTMLReportGenerator:
             facility_filter: Optional facility name to filter data
             static: If True, return base64-encoded PNG images; if False, return interactive HTML
         """
-        charts = {}
-
-        # Scope comparison chart
-        scope_chart = self.report_gen.create_scope_comparison_chart(facility_filter)
-        if scope_chart:
-            if static:
-                charts['scope_comparison'] = self._fig_to_base64_image(scope_chart)
-            else:
-                charts['scope_comparison'] = plotly.io.to_html(scope_chart, include_plotlyjs=False, div_id="scope-comparison-chart", config={'displayModeBar': True})
-
-        # Monthly trend chart
-        trend_chart = self.report_gen.create_monthly_trend_chart(facility_filter)
-        if trend_chart:
-            if static:
-                charts['monthly_trend'] = self._fig_to_base64_image(trend_chart, width=1400, height=500)
-            else:
-                charts['monthly_trend'] = plotly.io.to_html(trend_chart, include_plotlyjs=False, div_id="monthly-trend-chart", config={'displayModeBar': True})
-
-        # Sankey diagram - with proper configuration for better rendering
-        # Using threshold_percent=80 as default
-        sankey_chart = self.report_gen.create_sankey_diagram(facility_filter, threshold_percent=80)
-        if sankey_chart:
-            if static:
-                charts['sankey'] = self._fig_to_base64_image(sankey_chart, width=1400, height=700)
-            else:
-                charts['sankey'] = plotly.io.to_html(
-                    sankey_chart,
-                    include_plotlyjs=False,
-                    div_id="sankey-chart",
-                    config={'displayModeBar': True, 'responsive': True}
-                )
-
-        # Facility breakdown
-        facility_chart = self.report_gen.create_facility_breakdown_chart()
-        if facility_chart:
-            if static:
-                charts['facility_breakdown'] = self._fig_to_base64_image(facility_chart)
-            else:
-                charts['facility_breakdown'] = plotly.io.to_html(facility_chart, include_plotlyjs=False, div_id="facility-chart", config={'displayModeBar': True})
+        if self._chart_cache is None:
+            return self._render_charts(self._build_figures(facility_filter), static)
+
+        key = (facility_filter, static)
+        if key not in self._chart_cache:
+            # Figures are shared by the interactive (HTML) and static (PDF) renders
+            figures_key = (facility_filter, 'figures')
+            with self._figures_lock:
+                if figures_key not in self._chart_cache:
+                    self._chart_cache[figures_key] = self._build_figures(facility_filter)
+                figures = self._chart_cache[figures_key]
+            charts = self._render_charts(figures, static)
+            if None in charts.values():
+                # An image export failed; retry on the next report instead of caching it
+                return charts
+            self._chart_cache[key] = charts
+        return self._chart_cache[key]
+
+    def _build_figures(self, facility_filter=None):
+        """Build the report's Plotly figures (None where a chart has no data)"""
+        return {
+            'scope_comparison': self.report_gen.create_scope_comparison_chart(facility_filter),
+            'monthly_trend': self.report_gen.create_monthly_trend_chart(facility_filter),
+            # Sankey diagram using threshold_percent=80 as default
+            'sankey': self.report_gen.create_sankey_diagram(facility_filter, threshold_percent=80),
+            'facility_breakdown': self.report_gen.create_facility_breakdown_chart(),
+            'emission_by_source': self.report_gen.create_emission_by_source_chart()
+        }
+
+    def _render_charts(self, figures, static=False):
+        """Turn figures from _build_figures into HTML divs or static images"""
+        # chart name -> (div id, static image size)
+        chart_settings = {
+            'scope_comparison': ('scope-comparison-chart', {}),
+            'monthly_trend': ('monthly-trend-chart', {'width': 1400, 'height': 500}),
+            'sankey': ('sankey-chart', {'width': 1400, 'height': 700}),
+            'facility_breakdown': ('facility-chart', {}),
+            'emission_by_source': ('emission-chart', {})
+        }
 
-        # Emission By Source
-        emission_chart = self.report_gen.create_emission_by_source_chart()
-        if emission_chart:
+        charts = {}
+        for name, fig in figures.items():
+            if not fig:
+                continue
+            div_id, image_size = chart_settings[name]
             if static:
-                charts['emission_by_source'] = self._fig_to_base64_image(emission_chart)
+                charts[name] = self._fig_to_base64_image(fig, **image_size)
             else:
-                charts['emission_by_source'] = plotly.io.to_html(emission_chart, include_plotlyjs=False, div_id="emission-chart", config={'displayModeBar': True})
+                config = {'displayModeBar': True}
+                if name == 'sankey':
+                    # Sankey diagram - with proper configuration for better rendering
+                    config['responsive'] = True
+                charts[name] = plotly.io.to_html(fig, include_plotlyjs=False, div_id=div_id, config=config)
 
         return charts
 
@@ -19,6 +19,8 @@ class PDFReportGenerator:
         self.report_gen = report_generator
         self.styles = getSampleStyleSheet()
         self._setup_custom_styles()
+        # Per-report directory for chart images (set while a report is built)
+        self._image_dir = None
 
     def _setup_custom_styles(self):
         """Setup custom paragraph styles"""
@@ -60,7 +62,7 @@ class PDFReportGenerator:
             return None
 
         try:
-            temp_dir = tempfile.gettempdir()
+            temp_dir = self._image_dir or tempfile.gettempdir()
             image_path = os.path.join(temp_dir, f"{filename}.png")
             pio.write_image(fig, image_path, width=800, height=600, scale=1)
             return image_path
@@ -70,6 +72,17 @@ class PDFReportGenerator:
 
     def generate_pdf_report(self, output_path):
         """Generate comprehensive PDF report"""
+        # Chart images only need to exist until doc.build() has embedded them;
+        # the directory (and every image in it) is removed afterwards, even on error
+        with tempfile.TemporaryDirectory(prefix='ghg_charts_') as image_dir:
+            self._image_dir = image_dir
+            try:
+                return self._build_pdf_report(output_path)
+            finally:
+                self._image_dir = None
+
+    def _build_pdf_report(self, output_path):
+        """Build the PDF story and write it to output_path"""
         doc = SimpleDocTemplate(
             output_path,
             pagesize=A4,
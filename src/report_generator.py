@@ -14,10 +14,27 @@ class GHGReportGenerator:
         self.data = self._load_excel_data()
         self.report_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
+    @classmethod
+    def from_frames(cls, frames):
+        """Create a generator from already-built sheet DataFrames
+
+        Args:
+            frames: Dict of sheet name -> DataFrame, shaped like the result of
+                pd.read_excel(..., sheet_name=None) on a GHG workbook
+        """
+        generator = cls.__new__(cls)
+        generator.excel_file = None
+        generator.data = frames
+        generator.report_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        return generator
+
     def _load_excel_data(self):
         """Load data from all Excel sheets"""
         try:
-            excel_data = pd.read_excel(self.excel_file, sheet_name=None)
+            # Label columns are read as typed strings instead of object dtype;
+            # numeric sheets already come back as float64/int64
+            excel_data = pd.read_excel(self.excel_file, sheet_name=None,
+                                       dtype={'Source': 'string', 'Facility': 'string'})
             return excel_data
         except Exception as e:
             print(f"Error loading Excel file: {e}")
@@ -509,7 +526,10 @@ class GHGReportGenerator:
 
             # Total emissions by facility
             if all(col in facilities_df.columns for col in ['Scope_1', 'Scope_2', 'Scope_3']):
-                facilities_df['Total_Emissions'] = facilities_df['Scope_1'] + facilities_df['Scope_2'] + facilities_df['Scope_3']
+                # assign() returns a new frame; the loaded sheet is shared with
+                # other readers (exports, background report renders)
+                facilities_df = facilities_df.assign(
+                    Total_Emissions=facilities_df['Scope_1'] + facilities_df['Scope_2'] + facilities_df['Scope_3'])
 
                 fig.add_trace(go.Bar(
                     x=facilities_df['Facility'].tolist(),
@@ -1,51 +1,43 @@
 from weasyprint import HTML
-import tempfile
 import os
 from datetime import datetime
 from report_generator import GHGReportGenerator
 from html_report import HTMLReportGenerator
 
 class SimplePDFReportGenerator:
-    def __init__(self, report_generator):
+    def __init__(self, report_generator, html_gen=None):
+        """
+        Args:
+            report_generator: GHGReportGenerator holding the dataset
+            html_gen: Optional HTMLReportGenerator for the same dataset to
+                share (and its chart cache); a private one is created if None
+        """
         self.report_gen = report_generator
-        self.html_gen = HTMLReportGenerator(report_generator)
+        self.html_gen = html_gen or HTMLReportGenerator(report_generator)
 
     def generate_simple_pdf_report(self, output_path, use_ai=False):
         """Generate PDF report from HTML template using WeasyPrint
 
         Args:
-            output_path: Path to save PDF file
+            output_path: Path to save PDF file, or a writable binary file-like object
             use_ai: If True, use AI-generated recommendations
 
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            # Create temporary HTML file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as tmp_html:
-                tmp_html_path = tmp_html.name
-
-            # Generate HTML report first (with pdf_mode=True for static charts)
-            if not self.html_gen.generate_html_report(tmp_html_path, facility_filter=None, use_ai=use_ai, pdf_mode=True):
-                print("Failed to generate HTML template")
-                return False
+            # Render the HTML in memory first (with pdf_mode=True for static charts)
+            html_content = self.html_gen.render_to_string(use_ai=use_ai, pdf_mode=True)
 
-            # Convert HTML to PDF using WeasyPrint
-            HTML(filename=tmp_html_path).write_pdf(output_path)
+            # Convert HTML to PDF using WeasyPrint (logo and charts are embedded as data URIs)
+            HTML(string=html_content).write_pdf(output_path)
 
-            # Clean up temporary HTML file
-            os.unlink(tmp_html_path)
-
-            print(f"PDF report generated successfully: {output_path}")
+            if isinstance(output_path, (str, os.PathLike)):
+                print(f"PDF report generated successfully: {output_path}")
             return True
 
         except Exception as e:
             print(f"Error generating PDF report: {e}")
             import traceback
             traceback.print_exc()
-
-            # Clean up if exists
-            if 'tmp_html_path' in locals() and os.path.exists(tmp_html_path):
-                os.unlink(tmp_html_path)
-
             return False
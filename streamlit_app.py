@@ -1,24 +1,33 @@
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
+import numpy as np
 import io
-import base64
 from datetime import datetime, date
-import tempfile
 import os
 import sys
+import hashlib
+import math
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
 
 # Add src directory to path
 current_dir = os.path.dirname(__file__)
 src_dir = os.path.join(current_dir, 'src')
-sys.path.insert(0, src_dir)
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
 
-from report_generator import GHGReportGenerator
-from html_report import HTMLReportGenerator
-from simple_pdf_report import SimplePDFReportGenerator
-from excel_generator import GHGExcelGenerator
+# The report generators (and plotly behind them) are imported inside the
+# functions that load data, so pages without a dataset start without them
+
+# A list rather than a tuple: df[MONTHS] must select columns, and pandas reads
+# a tuple key as a single label
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+          'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+# Fixed sheet schemas for the manual dataset, passed as columns= so pandas
+# does not have to infer them from the record keys
+SCOPE_COLUMNS = ['Source', 'Annual_Total', 'Percentage'] + MONTHS
+FACILITY_COLUMNS = ['Facility', 'Scope_1', 'Scope_2', 'Scope_3', 'Energy_Intensity', 'Production']
 
 # Configure Streamlit page
 st.set_page_config(
@@ -112,6 +121,7 @@ def main():
     # Initialize session state
     if 'ghg_data' not in st.session_state:
         st.session_state.ghg_data = None
+        st.session_state.ghg_data_hash = None
     if 'company_info' not in st.session_state:
         st.session_state.company_info = {}
     if 'selected_facility' not in st.session_state:
@@ -214,7 +224,15 @@ def show_home_page():
         </div>
         """, unsafe_allow_html=True)
 
-    # Sample data demo
+    show_sample_data_demo()
+
+@st.fragment
+def show_sample_data_demo():
+    """Sample data loader on the home page
+
+    Runs as a fragment so the button click reruns only this block, not the
+    static home page cards above it.
+    """
     st.subheader("🎯 Try with Sample Data")
     if st.button("🧪 Load Sample GHG Data"):
         load_sample_data()
@@ -224,6 +242,74 @@ def show_home_page():
         </div>
         """, unsafe_allow_html=True)
 
+def dataset_digest(frames):
+    """Content digest of a {sheet_name: DataFrame} mapping
+
+    Used as the cache key for datasets that were not uploaded as a file, so
+    identical manual/sample data shares cached summaries and charts.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for sheet_name, df in frames.items():
+        digest.update(sheet_name.encode())
+        digest.update(repr(list(df.columns)).encode())
+        digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+def set_ghg_data(report_gen, data_key=None):
+    """Make report_gen the active dataset for this session
+
+    data_key identifies the dataset contents in the chart/summary caches;
+    when the caller has no file hash it is derived from the loaded sheets.
+    """
+    st.session_state.ghg_data = report_gen
+    st.session_state.ghg_data_hash = data_key or dataset_digest(report_gen.data)
+
+# Cached views of the active dataset. Entries are keyed on (data_key, filters);
+# the underscore-prefixed generator argument is not hashed by Streamlit.
+@st.cache_data(show_spinner=False, max_entries=64)
+def cached_summary(data_key, facility_filter, _ghg):
+    return _ghg.get_summary_statistics(facility_filter)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def cached_scope_chart(data_key, facility_filter, _ghg):
+    return _ghg.create_scope_comparison_chart(facility_filter)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def cached_trend_chart(data_key, facility_filter, _ghg):
+    return _ghg.create_monthly_trend_chart(facility_filter)
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def cached_sankey(data_key, facility_filter, threshold_percent, _ghg):
+    return _ghg.create_sankey_diagram(facility_filter=facility_filter, threshold_percent=threshold_percent)
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def get_html_generator(data_key, _ghg):
+    """Shared HTMLReportGenerator for the dataset identified by data_key"""
+    # Imported on first report build rather than on every app start
+    from html_report import HTMLReportGenerator
+    return HTMLReportGenerator(_ghg, cache_charts=True)
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def get_pdf_generator(data_key, _ghg):
+    """Shared SimplePDFReportGenerator for the dataset identified by data_key"""
+    # WeasyPrint is only needed once a PDF is requested
+    from simple_pdf_report import SimplePDFReportGenerator
+    # Shares the HTML generator so both report types reuse its chart cache
+    return SimplePDFReportGenerator(_ghg, get_html_generator(data_key, _ghg))
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def get_report_generator(file_hash, _data):
+    """Load an uploaded workbook once and share it across sessions
+
+    Keyed on the content hash only; ``_data`` is skipped by Streamlit's hasher.
+    Bounded like the report generator caches so old uploads are evicted.
+    The workbook is parsed straight from memory, and the buffer stays
+    readable for later re-reads (e.g. the Dashboard fallback in
+    get_company_info).
+    """
+    from report_generator import GHGReportGenerator
+    return GHGReportGenerator(io.BytesIO(_data))
+
 def show_upload_page():
     """Page for uploading Excel files"""
     st.header("📤 Upload Excel Template")
@@ -252,16 +338,13 @@ def show_upload_page():
 
     if uploaded_file is not None:
         try:
-            # Save uploaded file temporarily
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp_file:
-                tmp_file.write(uploaded_file.getvalue())
-                tmp_path = tmp_file.name
-
-            # Load data using report generator
-            report_gen = GHGReportGenerator(tmp_path)
+            # Load data using the cached report generator for this file
+            file_bytes = uploaded_file.getvalue()
+            file_hash = hashlib.blake2b(file_bytes, digest_size=16).hexdigest()
+            report_gen = get_report_generator(file_hash, file_bytes)
 
             if report_gen.data:
-                st.session_state.ghg_data = report_gen
+                set_ghg_data(report_gen, file_hash)
 
                 st.markdown("""
                 <div class="success-box">
@@ -281,7 +364,7 @@ def show_upload_page():
 
                 with col2:
                     # Show summary statistics (no facility filter for upload preview)
-                    summary = report_gen.get_summary_statistics(facility_filter=None)
+                    summary = cached_summary(file_hash, None, report_gen)
                     st.write("**Summary Statistics:**")
                     st.write(f"• Total Emissions: {summary.get('total_emissions', 0):,.0f} tCO2e")
                     st.write(f"• Scope 1: {summary.get('scope1_total', 0):,.0f} tCO2e")
@@ -303,9 +386,6 @@ def show_upload_page():
             else:
                 st.error("❌ Failed to load Excel file. Please check the file format and try again.")
 
-            # Clean up temporary file
-            os.unlink(tmp_path)
-
         except Exception as e:
             st.error(f"❌ Error processing Excel file: {str(e)}")
 
@@ -318,7 +398,9 @@ def show_manual_input_page():
     col1, col2 = st.columns(2)
 
     with col1:
-        company_name = st.text_input("Company Name", value="Your Company Name")
+        if 'company_name' not in st.session_state:
+            st.session_state.company_name = "Your Company Name"
+        company_name = st.text_input("Company Name", key="company_name")
         reporting_year = st.number_input("Reporting Year", value=2024, min_value=2020, max_value=2030)
 
     with col2:
@@ -359,9 +441,15 @@ def show_manual_input_page():
 
     st.markdown("---")
 
-    # Initialize facilities data in session state
+    # Initialize facilities data in session state, sized to the facility count
+    # so add_facility_emissions only assigns by index. Shrinking drops the
+    # entries of facilities that are no longer shown.
     if 'facilities_data' not in st.session_state:
         st.session_state.facilities_data = []
+    facilities_data = st.session_state.facilities_data
+    if len(facilities_data) != num_facilities:
+        st.session_state.facilities_data = (facilities_data[:int(num_facilities)] +
+                                            [{} for _ in range(int(num_facilities) - len(facilities_data))])
 
     # Facility Input Section
     st.subheader("🏭 Facility Emissions Data")
@@ -449,60 +537,50 @@ def show_manual_input_page():
         )
 
         emission_sources_data = []
-        months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
 
         if emission_input_method == "Annual Total":
-            for source in all_selected_emission_sources:
-                col1, col2 = st.columns([3, 1])
-                with col1:
-                    st.write(source)
-                with col2:
-                    annual_total = st.number_input(
-                        "tCO₂e/year",
-                        value=1000.0,
-                        min_value=0.0,
-                        step=100.0,
-                        key=f"emission_{source}_annual",
-                        label_visibility="collapsed"
-                    )
+            # One editable grid for all sources instead of a number_input per source
+            edited = source_values_editor(
+                "emission_annual", all_selected_emission_sources, ['Annual_Total_tCO2e'], 1000.0,
+                column_config={
+                    'Annual_Total_tCO2e': st.column_config.NumberColumn("tCO₂e/year", min_value=0.0, step=100.0)
+                }
+            )
 
+            for source, annual_total in zip(all_selected_emission_sources,
+                                            edited['Annual_Total_tCO2e'].tolist()):
                 emission_sources_data.append({
                     'Source': source,
                     'Annual_Total_tCO2e': annual_total,
-                    **{month: annual_total / 12 for month in months}
+                    **dict.fromkeys(MONTHS, annual_total / 12)
                 })
         else:
-            # Monthly input
-            for source in all_selected_emission_sources:
-                with st.expander(f"📊 {source} - Monthly Data", expanded=False):
-                    monthly_values = {}
-                    cols = st.columns(4)
-                    for i, month in enumerate(months):
-                        with cols[i % 4]:
-                            monthly_values[month] = st.number_input(
-                                month,
-                                value=100.0,
-                                min_value=0.0,
-                                step=10.0,
-                                key=f"emission_{source}_{month}"
-                            )
-
-                    annual_total = sum(monthly_values.values())
-                    st.write(f"**Annual Total: {annual_total:,.2f} tCO₂e**")
-
-                    emission_sources_data.append({
-                        'Source': source,
-                        'Annual_Total_tCO2e': annual_total,
-                        **monthly_values
-                    })
+            # Monthly input: one sources x months grid
+            edited = source_values_editor(
+                "emission_monthly", all_selected_emission_sources, MONTHS, 100.0,
+                column_config={
+                    month: st.column_config.NumberColumn(month, min_value=0.0, step=10.0)
+                    for month in MONTHS
+                }
+            )
+
+            for source, values in zip(all_selected_emission_sources,
+                                      edited[MONTHS].to_numpy().tolist()):
+                emission_sources_data.append({
+                    'Source': source,
+                    'Annual_Total_tCO2e': sum(values),
+                    **dict(zip(MONTHS, values))
+                })
+
+            st.caption("Annual totals: " + " · ".join(
+                f"{data['Source']}: {data['Annual_Total_tCO2e']:,.2f} tCO₂e" for data in emission_sources_data))
 
         # Store in session state
         st.session_state.emission_by_source_data = emission_sources_data
 
         # Show summary
         st.markdown("---")
-        total_emission_by_source = sum([s['Annual_Total_tCO2e'] for s in emission_sources_data])
+        total_emission_by_source = math.fsum(s['Annual_Total_tCO2e'] for s in emission_sources_data)
         st.metric("Total Emission By Source", f"{total_emission_by_source:,.0f} tCO₂e")
 
     st.markdown("---")
@@ -518,15 +596,19 @@ def show_manual_input_page():
         else:
             st.error("❌ Please enter emissions data for at least one facility.")
 
+@st.fragment
 def add_facility_emissions(facility_idx):
-    """Add emissions data for a specific facility with full source breakdown"""
+    """Add emissions data for a specific facility with full source breakdown
 
-    # Facility name
-    facility_name = st.text_input(
-        "Facility Name",
-        value=f"Facility {chr(65 + facility_idx)}",  # A, B, C, etc.
-        key=f"facility_{facility_idx}_name"
-    )
+    Runs as a fragment so editing one facility reruns only its own block
+    (inputs and summary metrics) instead of the whole manual input page.
+    """
+
+    # Facility name (default built once per facility: A, B, C, etc.)
+    name_key = f"facility_{facility_idx}_name"
+    if name_key not in st.session_state:
+        st.session_state[name_key] = f"Facility {chr(65 + facility_idx)}"
+    facility_name = st.text_input("Facility Name", key=name_key)
 
     # Production data
     production = st.number_input(
@@ -636,9 +718,10 @@ def add_facility_emissions(facility_idx):
             )
 
     # Calculate totals
-    scope1_total = sum([s['annual_total'] for s in facility_sources['scope1']])
-    scope2_total = sum([s['annual_total'] for s in facility_sources['scope2']])
-    scope3_total = sum([s['annual_total'] for s in facility_sources['scope3']])
+    scope1_total, scope2_total, scope3_total = (
+        math.fsum(s['annual_total'] for s in facility_sources[scope])
+        for scope in ('scope1', 'scope2', 'scope3')
+    )
     total_emissions = scope1_total + scope2_total + scope3_total
 
     # Summary metrics
@@ -671,9 +754,7 @@ def add_facility_emissions(facility_idx):
         'sources': facility_sources
     }
 
-    # Update session state
-    if len(st.session_state.facilities_data) <= facility_idx:
-        st.session_state.facilities_data.extend([{}] * (facility_idx + 1 - len(st.session_state.facilities_data)))
+    # Update session state (the list is sized by show_manual_input_page)
     st.session_state.facilities_data[facility_idx] = facility_data
 
 def add_custom_source_ui(facility_idx, scope, predefined_sources, selected_sources):
@@ -699,9 +780,8 @@ def add_custom_source_ui(facility_idx, scope, predefined_sources, selected_sourc
 
     # Handle adding new custom source
     if add_button and new_source_name:
-        # Check for duplicates
-        all_existing_sources = predefined_sources + selected_sources + custom_sources_list
-        if new_source_name in all_existing_sources:
+        # Check for duplicates without building a combined list
+        if new_source_name in chain(predefined_sources, selected_sources, custom_sources_list):
             st.error(f"❌ Error: '{new_source_name}' already exists. Please use a different name.")
         else:
             st.session_state.custom_sources[key].append(new_source_name)
@@ -722,6 +802,51 @@ def add_custom_source_ui(facility_idx, scope, predefined_sources, selected_sourc
 
     return custom_sources_list
 
+def source_values_editor(key, sources, columns, default, column_config):
+    """Editable sources x columns grid whose values are remembered by source name
+
+    st.data_editor identifies its widget by the input frame, so rebuilding
+    that frame for a new source list resets every typed value (or, on
+    versions that key edits by row position, moves them onto another
+    source). Values are therefore kept in session state as {source: [values]}
+    under ``{key}_values``. The editor input stays fixed while the widget is
+    live and the sources are unchanged, so successive edits accumulate on it;
+    otherwise it is rebuilt from the stored values under a new widget key.
+    Returns the edited frame indexed by source, with blanks read as 0.
+    """
+    values_key = f"{key}_values"
+    if values_key not in st.session_state:
+        st.session_state[values_key] = {}
+    stored = st.session_state[values_key]
+    editor_input = st.session_state.get(f"{key}_input")
+    editor_key = st.session_state.get(f"{key}_editor_key")
+
+    if (editor_input is None or editor_key not in st.session_state
+            or editor_input.index.tolist() != list(sources)):
+        editor_input = pd.DataFrame(
+            [stored.get(source, [default] * len(columns)) for source in sources],
+            index=pd.Index(sources, name='Source'),
+            columns=columns,
+            dtype=float
+        )
+        input_digest = hashlib.blake2b(
+            pd.util.hash_pandas_object(editor_input, index=True).to_numpy().tobytes(), digest_size=8
+        ).hexdigest()
+        editor_key = f"{key}_editor_{input_digest}"
+        st.session_state[f"{key}_input"] = editor_input
+        st.session_state[f"{key}_editor_key"] = editor_key
+
+    edited = st.data_editor(
+        editor_input,
+        key=editor_key,
+        column_config=column_config,
+        num_rows='fixed',
+        use_container_width=True
+    ).fillna(0)
+
+    stored.update(zip(sources, edited[columns].to_numpy().tolist()))
+    return edited
+
 def add_sources_with_data(facility_idx, scope, sources):
     """Add emission data for each source - supports annual or monthly input"""
 
@@ -736,60 +861,46 @@ def add_sources_with_data(facility_idx, scope, sources):
     )
 
     sources_data = []
-    months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-             'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
 
-    for source in sources:
-        st.write(f"**{source}**")
-
-        if input_method == "Annual Total (÷12 for monthly)":
-            col1, col2 = st.columns([3, 1])
-            with col1:
-                st.write(source)
-            with col2:
-                annual_total = st.number_input(
-                    "tCO2e/year",
-                    value=1000.0,
-                    min_value=0.0,
-                    step=50.0,
-                    key=f"facility_{facility_idx}_{scope}_{source}_annual",
-                    label_visibility="collapsed"
-                )
+    if input_method == "Annual Total (÷12 for monthly)":
+        # One editable grid for all sources instead of a number_input per source
+        edited = source_values_editor(
+            f"facility_{facility_idx}_{scope}_annual", sources, ['Annual_Total'], 1000.0,
+            column_config={
+                'Annual_Total': st.column_config.NumberColumn("tCO2e/year", min_value=0.0, step=50.0)
+            }
+        )
 
+        for source, annual_total in zip(sources, edited['Annual_Total'].tolist()):
             sources_data.append({
                 'source': source,
                 'annual_total': annual_total,
                 'input_method': 'annual',
-                'monthly_values': {month: annual_total / 12 for month in months}
+                'monthly_values': dict.fromkeys(MONTHS, annual_total / 12)
             })
 
-        else:  # Monthly input
-            with st.expander(f"📅 {source} - Monthly Data", expanded=False):
-                monthly_values = {}
-                for row_idx in range(4):
-                    cols = st.columns(3)
-                    for col_idx in range(3):
-                        month_idx = row_idx * 3 + col_idx
-                        month = months[month_idx]
-                        with cols[col_idx]:
-                            monthly_values[month] = st.number_input(
-                                month,
-                                value=85.0,
-                                min_value=0.0,
-                                step=5.0,
-                                key=f"facility_{facility_idx}_{scope}_{source}_{month}",
-                                label_visibility="visible"
-                            )
-
-                annual_total = sum(monthly_values.values())
-                st.write(f"Annual Total: {annual_total:,.2f} tCO2e")
-
-                sources_data.append({
-                    'source': source,
-                    'annual_total': annual_total,
-                    'input_method': 'monthly',
-                    'monthly_values': monthly_values
-                })
+        return sources_data
+
+    # One sources x months grid instead of twelve number_inputs per source
+    edited = source_values_editor(
+        f"facility_{facility_idx}_{scope}_monthly", sources, MONTHS, 85.0,
+        column_config={
+            month: st.column_config.NumberColumn(month, min_value=0.0, step=5.0)
+            for month in MONTHS
+        }
+    )
+
+    for source, values in zip(sources, edited[MONTHS].to_numpy().tolist()):
+        monthly_values = dict(zip(MONTHS, values))
+        sources_data.append({
+            'source': source,
+            'annual_total': sum(values),
+            'input_method': 'monthly',
+            'monthly_values': monthly_values
+        })
+
+    st.caption("Annual totals: " + " · ".join(
+        f"{data['source']}: {data['annual_total']:,.2f} tCO2e" for data in sources_data))
 
     return sources_data
 
@@ -798,38 +909,23 @@ def add_sources_with_data(facility_idx, scope, sources):
 def create_manual_dataset_from_facilities():
     """Create dataset from facility-level manual inputs"""
     try:
-        # Check if we have facility data
-        if not st.session_state.facilities_data or len(st.session_state.facilities_data) == 0:
+        # Reject before any heavy work if no facility has data yet
+        facilities_data = st.session_state.facilities_data
+        if not any(facilities_data):
             return False
 
         # Filter out empty facility data
-        valid_facilities = [f for f in st.session_state.facilities_data if f]
-
-        if len(valid_facilities) == 0:
-            return False
-
-        # Create temporary Excel file with facility data
-        excel_gen = GHGExcelGenerator()
-        excel_gen.company_info.update(st.session_state.company_info)
+        valid_facilities = [f for f in facilities_data if f]
 
         # Generate data structure from facility inputs
         manual_data = generate_data_from_facilities(valid_facilities)
 
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp_file:
-            tmp_path = tmp_file.name
-
-        # Create Excel file with real facility data
-        create_manual_excel(tmp_path, manual_data)
-
-        # Load with report generator
-        report_gen = GHGReportGenerator(tmp_path)
+        # Hand the sheet frames straight to the report generator (no Excel round trip)
+        from report_generator import GHGReportGenerator
+        report_gen = GHGReportGenerator.from_frames(create_manual_frames(manual_data))
 
         if report_gen.data:
-            st.session_state.ghg_data = report_gen
-
-            # Clean up temporary file
-            os.unlink(tmp_path)
+            set_ghg_data(report_gen)
             return True
 
         return False
@@ -844,85 +940,83 @@ def generate_data_from_facilities(facilities):
     """Generate data structure from real facility inputs with source-level detail
 
     Handles: Facility → Scope → Source → Monthly/Annual data
+    Scope and facility entries are typed DataFrames (SCOPE_COLUMNS /
+    FACILITY_COLUMNS), ready to be written as sheets.
     """
+    empty_scope = pd.DataFrame({
+        column: pd.Series(dtype='string' if column == 'Source' else 'float64')
+        for column in SCOPE_COLUMNS
+    })
     data = {
-        'scope1': [],
-        'scope2': [],
-        'scope3': [],
+        'scope1': empty_scope,
+        'scope2': empty_scope,
+        'scope3': empty_scope,
         'emission_by_source': [],
-        'facilities': [],
+        'facilities': pd.DataFrame(columns=FACILITY_COLUMNS),
         'totals': {}
     }
 
-    months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-             'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
 
-    # Aggregate sources across all facilities per scope
-    aggregated_sources = {
-        'scope1': {},
-        'scope2': {},
-        'scope3': {}
-    }
-
-    # Collect all sources from all facilities
+    # Flatten every facility/scope/source contribution into one row each:
+    # annual total followed by the 12 monthly values in a float64 vector.
+    # Each (scope, source) pair gets an integer id on first sight so the
+    # rows can be reduced with a single scatter-add instead of a groupby.
+    key_ids = {}
+    row_ids = []
+    rows = []
     for facility in facilities:
         sources = facility.get('sources', {})
 
         for scope in ['scope1', 'scope2', 'scope3']:
             for source_data in sources.get(scope, []):
-                source_name = source_data['source']
-
-                if source_name not in aggregated_sources[scope]:
-                    aggregated_sources[scope][source_name] = {
-                        'annual_total': 0,
-                        'monthly_values': {month: 0 for month in months}
-                    }
-
-                # Add this facility's contribution to the source
-                aggregated_sources[scope][source_name]['annual_total'] += source_data['annual_total']
+                monthly_values = source_data['monthly_values']
+                row_ids.append(key_ids.setdefault((scope, source_data['source']), len(key_ids)))
+                rows.append(np.fromiter(
+                    chain((source_data['annual_total'],),
+                          (monthly_values.get(month, 0) for month in MONTHS)),
+                    dtype=np.float64, count=len(MONTHS) + 1
+                ))
+
+    # Aggregate sources across all facilities per scope (first-seen order kept)
+    if key_ids:
+        source_totals = np.zeros((len(key_ids), len(MONTHS) + 1), dtype=np.float64)
+        np.add.at(source_totals, np.asarray(row_ids, dtype=np.intp), np.vstack(rows))
+        aggregated = pd.DataFrame(
+            source_totals,
+            index=pd.MultiIndex.from_tuples(list(key_ids), names=['scope', 'Source']),
+            columns=['Annual_Total'] + MONTHS
+        )
 
-                for month in months:
-                    aggregated_sources[scope][source_name]['monthly_values'][month] += source_data['monthly_values'].get(month, 0)
+        # Percentage within scope, vectorised over all sources at once
+        scope_totals = aggregated['Annual_Total'].groupby(level='scope').transform('sum')
+        aggregated.insert(1, 'Percentage', (aggregated['Annual_Total'] / scope_totals * 100).fillna(0))
 
-    # Create scope emission entries with source-level detail
-    for scope in ['scope1', 'scope2', 'scope3']:
-        for source_name, source_agg in aggregated_sources[scope].items():
-            annual_total = source_agg['annual_total']
-            monthly_vals = source_agg['monthly_values']
-
-            # Calculate percentage within scope
-            scope_total = sum([s['annual_total'] for s in aggregated_sources[scope].values()])
-            percentage = (annual_total / scope_total * 100) if scope_total > 0 else 0
-
-            data[scope].append({
-                'Source': source_name,
-                'Annual_Total': annual_total,
-                'Percentage': percentage,
-                **monthly_vals
-            })
+        # Create scope emission frames with source-level detail
+        for scope, scope_df in aggregated.groupby(level='scope', sort=False):
+            data[scope] = scope_df.droplevel('scope').reset_index()
 
     # Create facility breakdown with REAL user input data
-    scope1_total = 0
-    scope2_total = 0
-    scope3_total = 0
-
-    for facility in facilities:
-        facility_scope1 = facility.get('scope1_total', 0)
-        facility_scope2 = facility.get('scope2_total', 0)
-        facility_scope3 = facility.get('scope3_total', 0)
-
-        scope1_total += facility_scope1
-        scope2_total += facility_scope2
-        scope3_total += facility_scope3
-
-        data['facilities'].append({
-            'Facility': facility['name'],
-            'Scope_1': facility_scope1,
-            'Scope_2': facility_scope2,
-            'Scope_3': facility_scope3,
-            'Energy_Intensity': facility['intensity'],
-            'Production': facility['production']
-        })
+    # One (n_facilities, 3) array holds every scope total; missing values are NaN
+    scope_matrix = np.array(
+        [[facility.get('scope1_total', np.nan),
+          facility.get('scope2_total', np.nan),
+          facility.get('scope3_total', np.nan)] for facility in facilities],
+        dtype=np.float64
+    ).reshape(-1, 3)
+    scope1_total, scope2_total, scope3_total = np.nansum(scope_matrix, axis=0).tolist()
+
+    # Facility breakdown built column-wise so no per-row dtype inference is needed
+    scope_values = np.nan_to_num(scope_matrix)
+    data['facilities'] = pd.DataFrame({
+        'Facility': pd.array([facility['name'] for facility in facilities], dtype='string'),
+        'Scope_1': scope_values[:, 0],
+        'Scope_2': scope_values[:, 1],
+        'Scope_3': scope_values[:, 2],
+        'Energy_Intensity': np.fromiter((facility['intensity'] for facility in facilities),
+                                        dtype=np.float64, count=len(facilities)),
+        'Production': np.fromiter((facility['production'] for facility in facilities),
+                                  dtype=np.float64, count=len(facilities))
+    }, columns=FACILITY_COLUMNS)
 
     # Store totals
     grand_total = scope1_total + scope2_total + scope3_total
@@ -935,7 +1029,6 @@ def generate_data_from_facilities(facilities):
     }
 
     # Add emission_by_source data from session state
-    import streamlit as st
     if hasattr(st, 'session_state') and hasattr(st.session_state, 'emission_by_source_data'):
         data['emission_by_source'] = st.session_state.emission_by_source_data
     else:
@@ -946,61 +1039,73 @@ def generate_data_from_facilities(facilities):
 # OLD FUNCTION REMOVED - Used fake facility generation with arbitrary multipliers
 # Replaced by generate_data_from_facilities() which uses REAL user input
 
-def create_manual_excel(filepath, data):
-    """Create Excel file from manual data"""
-    with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-        # Dashboard sheet
-        company_info = st.session_state.company_info
-        summary_data = pd.DataFrame([
-            ['Company Name', company_info.get('name', 'Your Company')],
-            ['Reporting Year', company_info.get('reporting_year', 2024)],
-            ['Report Date', company_info.get('report_date', datetime.now().strftime('%Y-%m-%d'))],
-            ['Total GHG Emissions (tCO2e)', f"{data['totals']['grand_total']:.2f}"],
-            ['Scope 1 Emissions (tCO2e)', f"{data['totals']['scope1_total']:.2f}"],
-            ['Scope 2 Emissions (tCO2e)', f"{data['totals']['scope2_total']:.2f}"],
-            ['Scope 3 Emissions (tCO2e)', f"{data['totals']['scope3_total']:.2f}"],
-            ['Total Facilities', company_info.get('num_facilities', 4)]
-        ])
-        summary_data.to_excel(writer, sheet_name='Dashboard', index=False, header=False)
-
-        # Emission sheets
-        pd.DataFrame(data['scope1']).to_excel(writer, sheet_name='Scope 1 Emissions', index=False)
-        pd.DataFrame(data['scope2']).to_excel(writer, sheet_name='Scope 2 Emissions', index=False)
-        pd.DataFrame(data['scope3']).to_excel(writer, sheet_name='Scope 3 Emissions', index=False)
-        pd.DataFrame(data['facilities']).to_excel(writer, sheet_name='Facility Breakdown', index=False)
-
-        # Create Emission By Source sheet (use dummy data if not provided)
-        if 'emission_by_source' in data and data['emission_by_source']:
-            emission_data = pd.DataFrame(data['emission_by_source'])
-        else:
-            # Dummy data if user didn't input
-            emission_data = pd.DataFrame([
-                {'Source': 'Natural Gas', 'Annual_Total_tCO2e': 10000},
-                {'Source': 'Electricity', 'Annual_Total_tCO2e': 8000},
-                {'Source': 'Steam', 'Annual_Total_tCO2e': 5000}
-            ])
-        emission_data.to_excel(writer, sheet_name='Emission By Source', index=False)
-
-        targets_data = pd.DataFrame([
-            {'Metric': 'Total GHG Reduction Target (%)', 'Target_2024': 5, 'Actual_2024': 3.2, 'Status': 'On Track'}
-        ])
-        targets_data.to_excel(writer, sheet_name='Targets & Performance', index=False)
-
-        # Custom Text sheet
-        company_intro = company_info.get('company_introduction', '')
-        conclusion = company_info.get('conclusion_text', '')
-        custom_text_data = pd.DataFrame([
-            ['Field', 'Content'],
-            ['Company Introduction', company_intro],
-            ['Conclusion', conclusion]
-        ])
-        custom_text_data.to_excel(writer, sheet_name='Custom Text', index=False, header=False)
+def create_manual_frames(data):
+    """Build the manual dataset sheets as DataFrames
+
+    The frames match what pd.read_excel(sheet_name=None) returns for an
+    equivalent workbook (first row as header, empty text as NaN), so they
+    can be handed to GHGReportGenerator.from_frames directly.
+    """
+    company_info = st.session_state.company_info
+    frames = {}
+
+    # Dashboard sheet: the first label/value pair becomes the header row.
+    # Built column-wise; set_axis keeps both headers even if the company
+    # name happens to equal the 'Company Name' label.
+    totals = data['totals']
+    frames['Dashboard'] = pd.DataFrame({
+        0: ['Reporting Year', 'Report Date', 'Total GHG Emissions (tCO2e)',
+            'Scope 1 Emissions (tCO2e)', 'Scope 2 Emissions (tCO2e)',
+            'Scope 3 Emissions (tCO2e)', 'Total Facilities'],
+        1: [company_info.get('reporting_year', 2024),
+            company_info.get('report_date', datetime.now().strftime('%Y-%m-%d')),
+            f"{totals['grand_total']:.2f}",
+            f"{totals['scope1_total']:.2f}",
+            f"{totals['scope2_total']:.2f}",
+            f"{totals['scope3_total']:.2f}",
+            company_info.get('num_facilities', 4)]
+    }).set_axis(['Company Name', company_info.get('name', 'Your Company')], axis=1)
+
+    # Emission sheets (labels typed like _load_excel_data reads them)
+    frames['Scope 1 Emissions'] = data['scope1'].astype({'Source': 'string'})
+    frames['Scope 2 Emissions'] = data['scope2'].astype({'Source': 'string'})
+    frames['Scope 3 Emissions'] = data['scope3'].astype({'Source': 'string'})
+    frames['Facility Breakdown'] = data['facilities']
+
+    # Create Emission By Source sheet (use dummy data if not provided)
+    if 'emission_by_source' in data and data['emission_by_source']:
+        frames['Emission By Source'] = pd.DataFrame(data['emission_by_source']).astype({'Source': 'string'})
+    else:
+        # Dummy data if user didn't input
+        frames['Emission By Source'] = pd.DataFrame([
+            {'Source': 'Natural Gas', 'Annual_Total_tCO2e': 10000},
+            {'Source': 'Electricity', 'Annual_Total_tCO2e': 8000},
+            {'Source': 'Steam', 'Annual_Total_tCO2e': 5000}
+        ]).astype({'Source': 'string'})
+
+    frames['Targets & Performance'] = pd.DataFrame(
+        [['Total GHG Reduction Target (%)', 5, 3.2, 'On Track']],
+        columns=['Metric', 'Target_2024', 'Actual_2024', 'Status']
+    )
+
+    # Custom Text sheet (empty text reads back from Excel as NaN)
+    frames['Custom Text'] = pd.DataFrame({
+        'Field': ['Company Introduction', 'Conclusion'],
+        'Content': [company_info.get('company_introduction', '') or np.nan,
+                    company_info.get('conclusion_text', '') or np.nan]
+    })
+
+    return frames
 
 def show_reports_page():
     """Page for generating reports"""
     st.header("📊 Generate Reports")
 
-    if st.session_state.ghg_data is None:
+    # One timestamp per page render, shared by both download filenames
+    page_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+    ghg = st.session_state.ghg_data
+    if ghg is None:
         st.markdown("""
         <div class="warning-box">
             ⚠️ No GHG data loaded. Please either:
@@ -1017,8 +1122,13 @@ def show_reports_page():
     st.subheader("🏭 Facility Selection")
 
     # Get list of facilities from data
-    facilities_df = st.session_state.ghg_data.data.get('Facility Breakdown', pd.DataFrame())
-    facility_options = ['All Facilities'] + list(facilities_df['Facility'].values) if not facilities_df.empty and 'Facility' in facilities_df.columns else ['All Facilities']
+    facilities_df = ghg.data.get('Facility Breakdown', pd.DataFrame())
+    # Blank Facility cells load as <NA> (string dtype) and are not selectable filters
+    if not facilities_df.empty and 'Facility' in facilities_df.columns:
+        facilities = facilities_df['Facility'].dropna().tolist()
+    else:
+        facilities = []
+    facility_options = ['All Facilities'] + facilities
 
     selected_facility = st.selectbox(
         "Select facility to view:",
@@ -1028,11 +1138,13 @@ def show_reports_page():
 
     # Store selected facility in session state for report generation
     st.session_state.selected_facility = selected_facility
+    facility_filter = None if selected_facility == 'All Facilities' else selected_facility
 
     st.markdown("---")
 
     # Show data summary (filtered if specific facility selected)
-    summary = st.session_state.ghg_data.get_summary_statistics(selected_facility if selected_facility != 'All Facilities' else None)
+    data_key = st.session_state.ghg_data_hash
+    summary = cached_summary(data_key, facility_filter, ghg)
 
     st.subheader(f"📈 Data Summary - {selected_facility}")
     col1, col2, col3, col4 = st.columns(4)
@@ -1055,13 +1167,13 @@ def show_reports_page():
 
     with col1:
         # Scope comparison chart
-        scope_chart = st.session_state.ghg_data.create_scope_comparison_chart(selected_facility if selected_facility != 'All Facilities' else None)
+        scope_chart = cached_scope_chart(data_key, facility_filter, ghg)
         if scope_chart:
             st.plotly_chart(scope_chart, use_container_width=True)
 
     with col2:
         # Monthly trend chart
-        trend_chart = st.session_state.ghg_data.create_monthly_trend_chart(selected_facility if selected_facility != 'All Facilities' else None)
+        trend_chart = cached_trend_chart(data_key, facility_filter, ghg)
         if trend_chart:
             st.plotly_chart(trend_chart, use_container_width=True)
 
@@ -1082,10 +1194,7 @@ def show_reports_page():
             help="Show individual sources up to this percentage. Remaining sources grouped as 'Others'."
         )
 
-    sankey_chart = st.session_state.ghg_data.create_sankey_diagram(
-        facility_filter=selected_facility if selected_facility != 'All Facilities' else None,
-        threshold_percent=threshold_percent
-    )
+    sankey_chart = cached_sankey(data_key, facility_filter, threshold_percent, ghg)
     if sankey_chart:
         st.plotly_chart(sankey_chart, use_container_width=True)
 
@@ -1126,14 +1235,30 @@ def show_reports_page():
             else:
                 st.warning("⚠️ Please enter your OpenAI API key to use AI recommendations")
 
-        # Store in session state
-        st.session_state.use_ai_recommendations = use_ai_recs and bool(api_key_input)
+        use_ai = use_ai_recs and bool(api_key_input)
     else:
-        st.session_state.use_ai_recommendations = False
+        use_ai = False
         st.info("💡 Using rule-based recommendations (threshold-driven analysis)")
 
+    # Store in session state
+    st.session_state.use_ai_recommendations = use_ai
+
     st.markdown("---")
 
+    # Generated bytes are kept in session state with the settings they were
+    # built for, so the download buttons survive their own rerun without a rebuild
+    html_key = (data_key, facility_filter, use_ai)
+    pdf_key = (data_key, use_ai)
+
+    # Both reports at once: rendered in parallel, before the columns below
+    # read the stored downloads
+    if st.button("📥 Generate HTML & PDF Reports"):
+        html_report, pdf_report = generate_both_reports(facility_filter)
+        if html_report:
+            st.session_state.html_download = (html_key, html_report)
+        if pdf_report:
+            st.session_state.pdf_download = (pdf_key, pdf_report)
+
     col1, col2 = st.columns(2)
 
     with col1:
@@ -1141,14 +1266,18 @@ def show_reports_page():
         st.write("Comprehensive report with interactive charts and navigation")
 
         if st.button("📥 Generate & Download HTML Report", type="primary"):
-            html_report = generate_html_report()
+            html_report = generate_html_report(facility_filter)
             if html_report:
-                st.download_button(
-                    label="📥 Download HTML Report",
-                    data=html_report,
-                    file_name=f"GHG_Report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html",
-                    mime="text/html"
-                )
+                st.session_state.html_download = (html_key, html_report)
+
+        html_download = st.session_state.get('html_download')
+        if html_download and html_download[0] == html_key:
+            st.download_button(
+                label="📥 Download HTML Report",
+                data=html_download[1],
+                file_name=f"GHG_Report_{page_timestamp}.html",
+                mime="text/html"
+            )
 
     with col2:
         st.markdown("### 📄 Professional PDF Report")
@@ -1157,17 +1286,23 @@ def show_reports_page():
         if st.button("📥 Generate & Download PDF Report", type="primary"):
             pdf_report = generate_pdf_report()
             if pdf_report:
-                st.download_button(
-                    label="📥 Download PDF Report",
-                    data=pdf_report,
-                    file_name=f"GHG_Report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
-                    mime="application/pdf"
-                )
+                st.session_state.pdf_download = (pdf_key, pdf_report)
+
+        pdf_download = st.session_state.get('pdf_download')
+        if pdf_download and pdf_download[0] == pdf_key:
+            st.download_button(
+                label="📥 Download PDF Report",
+                data=pdf_download[1],
+                file_name=f"GHG_Report_{page_timestamp}.pdf",
+                mime="application/pdf"
+            )
 
 def show_template_page():
     """Page for downloading Excel templates"""
     st.header("📋 Download Excel Template")
 
+    page_date = datetime.now().strftime('%Y%m%d')
+
     st.markdown("""
     <div class="info-box">
         <h4>📊 Excel Template Information</h4>
@@ -1215,7 +1350,7 @@ def show_template_page():
             st.download_button(
                 label="📥 Download Blank Excel Template",
                 data=template_data,
-                file_name=f"GHG_Template_Blank_{datetime.now().strftime('%Y%m%d')}.xlsx",
+                file_name=f"GHG_Template_Blank_{page_date}.xlsx",
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
             )
 
@@ -1228,7 +1363,7 @@ def show_template_page():
             st.download_button(
                 label="📥 Download Sample Excel Template",
                 data=sample_data,
-                file_name=f"GHG_Template_Sample_{datetime.now().strftime('%Y%m%d')}.xlsx",
+                file_name=f"GHG_Template_Sample_{page_date}.xlsx",
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
             )
 
@@ -1351,27 +1486,26 @@ def show_help_page():
         each emission category and data field.
         """)
 
+@st.cache_resource(show_spinner=False, max_entries=2)
+def sample_report_generator(report_date):
+    """Sample dataset generator and its digest, built once per process and report date"""
+    from excel_generator import GHGExcelGenerator
+    excel_gen = GHGExcelGenerator(report_date=report_date)
+
+    # Build the sheets as DataFrames directly; no xlsx write/parse round trip
+    from report_generator import GHGReportGenerator
+    report_gen = GHGReportGenerator.from_frames(excel_gen.to_frames())
+    data_key = dataset_digest(report_gen.data)
+    prewarm_reports(data_key, report_gen)
+    return report_gen, data_key
+
 def load_sample_data():
     """Load sample GHG data"""
     try:
-        # Create sample data using the existing generator
-        excel_gen = GHGExcelGenerator()
-
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp_file:
-            tmp_path = tmp_file.name
-
-        # Generate sample Excel file
-        excel_gen.create_excel_template(tmp_path)
-
-        # Load with report generator
-        report_gen = GHGReportGenerator(tmp_path)
+        report_gen, data_key = sample_report_generator(datetime.now().strftime('%Y-%m-%d'))
 
         if report_gen.data:
-            st.session_state.ghg_data = report_gen
-
-            # Clean up
-            os.unlink(tmp_path)
+            set_ghg_data(report_gen, data_key)
             return True
 
         return False
@@ -1380,34 +1514,57 @@ def load_sample_data():
         st.error(f"Error loading sample data: {str(e)}")
         return False
 
-def generate_html_report():
-    """Generate HTML report and return as string"""
+@st.cache_resource(show_spinner=False)
+def get_prewarm_pool():
+    """Process-wide worker pool for background and parallel report rendering"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix='ghg-prewarm')
+
+def prewarm_reports(data_key, report_gen):
+    """Render the default HTML and PDF reports in parallel, in the background
+
+    Only used for the built-in sample dataset, which is built once per
+    process and shared by every session; uploaded and manual datasets render
+    their reports when the user asks for them (see generate_both_reports).
+    The two renders are independent and run on separate pool workers. Fills
+    the cached_html_report / cached_pdf_report entries for the
+    all-facilities, non-AI report so the first download click is a cache
+    hit. Workers get explicit arguments because session state is not
+    available off the script thread; a failed render is simply not cached.
+    """
+    pool = get_prewarm_pool()
+    pool.submit(cached_html_report, data_key, None, False, report_gen)
+    pool.submit(cached_pdf_report, data_key, False, report_gen)
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def cached_html_report(data_key, facility_filter, use_ai, _ghg):
+    """Rendered HTML report bytes (UTF-8) for a dataset/facility/AI setting"""
+    # render_to_string raises on failure, so a failed render is not cached.
+    # Encoding once here saves download_button re-encoding the str per download.
+    return get_html_generator(data_key, _ghg).render_to_string(facility_filter, use_ai=use_ai).encode('utf-8')
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def cached_pdf_report(data_key, use_ai, _ghg):
+    """Rendered PDF report bytes for a dataset/AI setting"""
+    buffer = io.BytesIO()
+    if not get_pdf_generator(data_key, _ghg).generate_simple_pdf_report(buffer, use_ai=use_ai):
+        raise RuntimeError("PDF report generation failed")
+    return buffer.getvalue()
+
+def generate_html_report(facility_filter=None):
+    """Generate HTML report and return as UTF-8 bytes
+
+    Args:
+        facility_filter: Facility name to report on, or None for all facilities
+    """
     try:
-        if st.session_state.ghg_data is None:
+        ghg_data = st.session_state.get('ghg_data')
+        if ghg_data is None:
             return None
 
-        html_generator = HTMLReportGenerator(st.session_state.ghg_data)
-
-        # Get selected facility if available
-        facility_filter = None
-        if 'selected_facility' in st.session_state and st.session_state.selected_facility != 'All Facilities':
-            facility_filter = st.session_state.selected_facility
-
-        # Create temporary file for HTML
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.html', mode='w') as tmp_file:
-            tmp_path = tmp_file.name
-
         # Get use_ai from session state
         use_ai = st.session_state.get('use_ai_recommendations', False)
 
-        if html_generator.generate_html_report(tmp_path, facility_filter, use_ai=use_ai):
-            with open(tmp_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-
-            os.unlink(tmp_path)
-            return html_content
-
-        return None
+        return cached_html_report(st.session_state.ghg_data_hash, facility_filter, use_ai, ghg_data)
 
     except Exception as e:
         st.error(f"Error generating HTML report: {str(e)}")
@@ -1416,75 +1573,113 @@ def generate_html_report():
 def generate_pdf_report():
     """Generate PDF report and return as bytes"""
     try:
-        if st.session_state.ghg_data is None:
+        ghg_data = st.session_state.get('ghg_data')
+        if ghg_data is None:
             return None
 
-        pdf_generator = SimplePDFReportGenerator(st.session_state.ghg_data)
-
-        # Create temporary file for PDF
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-            tmp_path = tmp_file.name
-
         # Get use_ai from session state
         use_ai = st.session_state.get('use_ai_recommendations', False)
 
-        if pdf_generator.generate_simple_pdf_report(tmp_path, use_ai=use_ai):
-            with open(tmp_path, 'rb') as f:
-                pdf_content = f.read()
-
-            os.unlink(tmp_path)
-            return pdf_content
-
-        return None
+        return cached_pdf_report(st.session_state.ghg_data_hash, use_ai, ghg_data)
 
     except Exception as e:
         st.error(f"Error generating PDF report: {str(e)}")
         return None
 
-def create_blank_template():
-    """Create blank Excel template"""
-    try:
-        excel_gen = GHGExcelGenerator()
+def generate_both_reports(facility_filter=None):
+    """Generate the HTML and PDF reports in parallel
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp_file:
-            tmp_path = tmp_file.name
+    The two renders are independent and share the dataset's cached chart
+    figures, so they run on the two prewarm pool workers while the script
+    waits. Returns (html_bytes, pdf_bytes); a failed report is None.
+    """
+    ghg_data = st.session_state.get('ghg_data')
+    if ghg_data is None:
+        return None, None
+
+    # Workers cannot read session state, so settings are passed explicitly
+    use_ai = st.session_state.get('use_ai_recommendations', False)
+    data_key = st.session_state.ghg_data_hash
+
+    pool = get_prewarm_pool()
+    futures = {
+        'HTML': pool.submit(cached_html_report, data_key, facility_filter, use_ai, ghg_data),
+        'PDF': pool.submit(cached_pdf_report, data_key, use_ai, ghg_data)
+    }
 
-        # Create template with minimal data
-        excel_gen.company_info = {
-            'name': '[Your Company Name]',
-            'reporting_year': 2024,
-            'report_date': datetime.now().strftime('%Y-%m-%d'),
-            'facilities': ['Facility A', 'Facility B', 'Facility C', 'Facility D']
-        }
+    reports = []
+    for report_type, future in futures.items():
+        try:
+            reports.append(future.result())
+        except Exception as e:
+            st.error(f"Error generating {report_type} report: {str(e)}")
+            reports.append(None)
+    return tuple(reports)
 
-        excel_gen.create_excel_template(tmp_path)
+@st.cache_data(show_spinner=False, persist="disk", max_entries=4)
+def blank_template_bytes(report_date):
+    """Blank template workbook, generated once per report date
 
-        with open(tmp_path, 'rb') as f:
-            template_data = f.read()
+    Persisted to Streamlit's on-disk cache so restarts on the same day
+    reload the bytes instead of rebuilding the workbook.
+    """
 
-        os.unlink(tmp_path)
-        return template_data
+    # Imported on first template request rather than on every app start
+    from excel_generator import GHGExcelGenerator
 
-    except Exception as e:
-        st.error(f"Error creating blank template: {str(e)}")
-        return None
+    # Create template with minimal data
+    excel_gen = GHGExcelGenerator(
+        name='[Your Company Name]',
+        reporting_year=2024,
+        report_date=report_date,
+        facilities=['Facility A', 'Facility B', 'Facility C', 'Facility D']
+    )
 
-def create_sample_template():
-    """Create sample Excel template with data"""
-    try:
-        excel_gen = GHGExcelGenerator()
+    buffer = io.BytesIO()
+    excel_gen.create_excel_template(buffer)
+    return buffer.getvalue()
+
+@st.cache_data(show_spinner=False, persist="disk", max_entries=16)
+def sample_template_bytes(report_date, reporting_year, facilities):
+    """Sample template workbook, generated once per selection (disk-persisted)
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp_file:
-            tmp_path = tmp_file.name
+    Args:
+        report_date: Report date string written to the Dashboard sheet
+        reporting_year: Reporting year written to the Dashboard sheet
+        facilities: Tuple of facility names (a tuple so it hashes)
+    """
+    from excel_generator import GHGExcelGenerator
+    excel_gen = GHGExcelGenerator(report_date=report_date,
+                                  reporting_year=reporting_year,
+                                  facilities=list(facilities))
 
-        # Generate sample Excel file with full data
-        excel_gen.create_excel_template(tmp_path)
+    # Generate sample Excel workbook with full data in memory
+    buffer = io.BytesIO()
+    excel_gen.create_excel_template(buffer)
+    return buffer.getvalue()
 
-        with open(tmp_path, 'rb') as f:
-            template_data = f.read()
+def create_blank_template():
+    """Create blank Excel template"""
+    try:
+        return blank_template_bytes(datetime.now().strftime('%Y-%m-%d'))
 
-        os.unlink(tmp_path)
-        return template_data
+    except Exception as e:
+        st.error(f"Error creating blank template: {str(e)}")
+        return None
+
+def create_sample_template(reporting_year=None, facilities=None):
+    """Create sample Excel template with data
+
+    Args:
+        reporting_year: Reporting year, or None for the generator default
+        facilities: Facility names, or None for the generator default
+    """
+    try:
+        from excel_generator import GHGExcelGenerator
+        defaults = GHGExcelGenerator().company_info
+        return sample_template_bytes(datetime.now().strftime('%Y-%m-%d'),
+                                     reporting_year or defaults['reporting_year'],
+                                     tuple(facilities or defaults['facilities']))
 
     except Exception as e:
         st.error(f"Error creating sample template: {str(e)}")
@@ -15,10 +15,11 @@ from pathlib import Path
 from datetime import datetime, timedelta
 import random
 
-# Add src directory to path for imports
+# Add src directory (and the project root, for streamlit_app) to path for imports
 TEST_DIR = Path(__file__).parent
 ROOT_DIR = TEST_DIR.parent
 SRC_DIR = ROOT_DIR / 'src'
+sys.path.insert(0, str(ROOT_DIR))
 sys.path.insert(0, str(SRC_DIR))
 
 @pytest.fixture(scope="session")
@@ -34,9 +35,27 @@ def temp_output_dir():
     with tempfile.TemporaryDirectory() as temp_dir:
         yield Path(temp_dir)
 
-@pytest.fixture
-def mock_company_info():
-    """Provide mock company information"""
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+          'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+# Sample data is built by plain functions so that the session-scoped
+# *_excel_file fixtures (each workbook written once per run) and the
+# per-test data fixtures below share it. The builders seed their own
+# generators rather than relying on setup_test_environment, which only runs
+# per test, and each uses a different seed so the sheets are not drawn from
+# the same random sequence.
+def _monthly_frame(rng, label_column, labels, low, high, **extra_columns):
+    """Build a sources x months DataFrame of uniform values with an Annual_Total column"""
+    monthly = rng.uniform(low, high, size=(len(labels), len(MONTHS)))
+    frame = pd.DataFrame(monthly, columns=MONTHS)
+    frame.insert(0, label_column, labels)
+    frame.insert(1, 'Annual_Total', monthly.sum(axis=1))
+    for position, (name, values) in enumerate(extra_columns.items(), start=2):
+        frame.insert(position, name, values)
+    return frame
+
+def _mock_company_info():
+    """Build mock company information"""
     return {
         'name': 'TestCorp Petroleum',
         'reporting_year': 2024,
@@ -44,53 +63,22 @@ def mock_company_info():
         'facilities': ['Test Refinery A', 'Test Platform B', 'Test Distribution C', 'Test Storage D']
     }
 
-@pytest.fixture
-def sample_scope1_data():
+def _sample_scope1_data():
     """Generate sample Scope 1 emissions data"""
     sources = [
         'Combustion - Natural Gas', 'Combustion - Fuel Oil', 'Combustion - Diesel',
         'Process Emissions - Refining', 'Fugitive - Equipment Leaks', 'Fugitive - Venting',
         'Mobile Combustion - Fleet', 'Flaring', 'Process Venting'
     ]
+    # Percentage will be calculated
+    return _monthly_frame(np.random.default_rng(101), 'Source', sources, 800, 2500, Percentage=0)
 
-    months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-             'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-
-    data = []
-    for source in sources:
-        monthly_values = [random.uniform(800, 2500) for _ in months]
-        annual_total = sum(monthly_values)
-        data.append({
-            'Source': source,
-            'Annual_Total': annual_total,
-            'Percentage': 0,  # Will be calculated
-            **dict(zip(months, monthly_values))
-        })
-
-    return data
-
-@pytest.fixture
-def sample_scope2_data():
+def _sample_scope2_data():
     """Generate sample Scope 2 emissions data"""
     sources = ['Purchased Electricity', 'Purchased Steam', 'Purchased Heat/Cooling']
-    months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-             'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-
-    data = []
-    for source in sources:
-        monthly_values = [random.uniform(300, 1200) for _ in months]
-        annual_total = sum(monthly_values)
-        data.append({
-            'Source': source,
-            'Annual_Total': annual_total,
-            'Percentage': 0,
-            **dict(zip(months, monthly_values))
-        })
-
-    return data
+    return _monthly_frame(np.random.default_rng(102), 'Source', sources, 300, 1200, Percentage=0)
 
-@pytest.fixture
-def sample_scope3_data():
+def _sample_scope3_data():
     """Generate sample Scope 3 emissions data"""
     sources = [
         'Purchased Goods/Services', 'Capital Goods', 'Fuel/Energy Activities',
@@ -98,64 +86,36 @@ def sample_scope3_data():
         'Employee Commuting', 'Transportation - Downstream', 'Processing of Products',
         'Use of Sold Products', 'End-of-life Products', 'Leased Assets'
     ]
+    return _monthly_frame(np.random.default_rng(103), 'Source', sources, 100, 800, Percentage=0)
 
-    months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-             'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-
-    data = []
-    for source in sources:
-        monthly_values = [random.uniform(100, 800) for _ in months]
-        annual_total = sum(monthly_values)
-        data.append({
-            'Source': source,
-            'Annual_Total': annual_total,
-            'Percentage': 0,
-            **dict(zip(months, monthly_values))
-        })
-
-    return data
-
-@pytest.fixture
-def sample_energy_data():
+def _sample_energy_data():
     """Generate sample energy consumption data"""
     energy_sources = [
         'Natural Gas (MWh)', 'Electricity (MWh)', 'Steam (MWh)',
         'Fuel Oil (MWh)', 'Diesel (MWh)', 'Gasoline (MWh)'
     ]
+    rng = np.random.default_rng(104)
+    return _monthly_frame(rng, 'Energy_Source', energy_sources, 5000, 15000,
+                          Emission_Factor=rng.uniform(0.2, 0.8, size=len(energy_sources)))
 
-    months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-             'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-
-    data = []
-    for source in energy_sources:
-        monthly_values = [random.uniform(5000, 15000) for _ in months]
-        data.append({
-            'Energy_Source': source,
-            'Annual_Total': sum(monthly_values),
-            'Emission_Factor': random.uniform(0.2, 0.8),
-            **dict(zip(months, monthly_values))
-        })
-
-    return data
-
-@pytest.fixture
-def sample_facility_data(mock_company_info):
+def _sample_facility_data(company_info):
     """Generate sample facility data"""
-    data = []
-    for facility in mock_company_info['facilities']:
-        data.append({
-            'Facility': facility,
-            'Scope_1': random.uniform(8000, 25000),
-            'Scope_2': random.uniform(3000, 12000),
-            'Scope_3': random.uniform(5000, 18000),
-            'Energy_Intensity': random.uniform(2.5, 8.0),
-            'Production': random.uniform(50000, 200000)
-        })
-
-    return data
-
-@pytest.fixture
-def sample_targets_data():
+    # Column -> (low, high) sampling range
+    ranges = {
+        'Scope_1': (8000, 25000),
+        'Scope_2': (3000, 12000),
+        'Scope_3': (5000, 18000),
+        'Energy_Intensity': (2.5, 8.0),
+        'Production': (50000, 200000)
+    }
+    low, high = np.array(list(ranges.values())).T
+    facilities = company_info['facilities']
+    values = np.random.default_rng(105).uniform(low, high, size=(len(facilities), len(ranges)))
+    frame = pd.DataFrame(values, columns=list(ranges))
+    frame.insert(0, 'Facility', facilities)
+    return frame
+
+def _sample_targets_data():
     """Generate sample targets and performance data"""
     return [
         {'Metric': 'Total GHG Reduction Target (%)', 'Target_2024': 5, 'Actual_2024': 3.2, 'Target_2025': 10, 'Status': 'On Track'},
@@ -165,12 +125,48 @@ def sample_targets_data():
         {'Metric': 'Carbon Capture Implementation', 'Target_2024': 2, 'Actual_2024': 1, 'Target_2025': 4, 'Status': 'Delayed'}
     ]
 
+# Per-test data fixtures: every test gets freshly built objects, so a test
+# that mutates a frame or dict cannot affect the tests that run after it
 @pytest.fixture
-def valid_excel_file(test_data_dir, sample_scope1_data, sample_scope2_data,
-                     sample_scope3_data, sample_energy_data, sample_facility_data,
-                     sample_targets_data, mock_company_info):
+def mock_company_info():
+    """Provide mock company information"""
+    return _mock_company_info()
+
+@pytest.fixture
+def sample_scope1_data():
+    """Provide sample Scope 1 emissions data"""
+    return _sample_scope1_data()
+
+@pytest.fixture
+def sample_scope2_data():
+    """Provide sample Scope 2 emissions data"""
+    return _sample_scope2_data()
+
+@pytest.fixture
+def sample_scope3_data():
+    """Provide sample Scope 3 emissions data"""
+    return _sample_scope3_data()
+
+@pytest.fixture
+def sample_energy_data():
+    """Provide sample energy consumption data"""
+    return _sample_energy_data()
+
+@pytest.fixture
+def sample_facility_data(mock_company_info):
+    """Provide sample facility data"""
+    return _sample_facility_data(mock_company_info)
+
+@pytest.fixture
+def sample_targets_data():
+    """Provide sample targets and performance data"""
+    return _sample_targets_data()
+
+@pytest.fixture(scope="session")
+def valid_excel_file(test_data_dir):
     """Create a valid Excel file for testing"""
     file_path = test_data_dir / 'test_ghg_data.xlsx'
+    mock_company_info = _mock_company_info()
 
     with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
         # Dashboard sheet
@@ -183,18 +179,18 @@ def valid_excel_file(test_data_dir, sample_scope1_data, sample_scope2_data,
         summary_data.to_excel(writer, sheet_name='Dashboard', index=False, header=False)
 
         # Emissions sheets
-        pd.DataFrame(sample_scope1_data).to_excel(writer, sheet_name='Scope 1 Emissions', index=False)
-        pd.DataFrame(sample_scope2_data).to_excel(writer, sheet_name='Scope 2 Emissions', index=False)
-        pd.DataFrame(sample_scope3_data).to_excel(writer, sheet_name='Scope 3 Emissions', index=False)
+        _sample_scope1_data().to_excel(writer, sheet_name='Scope 1 Emissions', index=False)
+        _sample_scope2_data().to_excel(writer, sheet_name='Scope 2 Emissions', index=False)
+        _sample_scope3_data().to_excel(writer, sheet_name='Scope 3 Emissions', index=False)
 
         # Energy and facility sheets
-        pd.DataFrame(sample_energy_data).to_excel(writer, sheet_name='Energy Consumption', index=False)
-        pd.DataFrame(sample_facility_data).to_excel(writer, sheet_name='Facility Breakdown', index=False)
-        pd.DataFrame(sample_targets_data).to_excel(writer, sheet_name='Targets & Performance', index=False)
+        _sample_energy_data().to_excel(writer, sheet_name='Energy Consumption', index=False)
+        _sample_facility_data(mock_company_info).to_excel(writer, sheet_name='Facility Breakdown', index=False)
+        pd.DataFrame(_sample_targets_data()).to_excel(writer, sheet_name='Targets & Performance', index=False)
 
     return file_path
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_excel_file(test_data_dir):
     """Create an invalid Excel file for testing error handling"""
     file_path = test_data_dir / 'invalid_ghg_data.xlsx'
@@ -210,7 +206,7 @@ def invalid_excel_file(test_data_dir):
 
     return file_path
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def empty_excel_file(test_data_dir):
     """Create an empty Excel file for testing"""
     file_path = test_data_dir / 'empty_ghg_data.xlsx'
@@ -221,27 +217,20 @@ def empty_excel_file(test_data_dir):
 
     return file_path
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def large_dataset_excel_file(test_data_dir):
     """Create a large Excel file for performance testing"""
     file_path = test_data_dir / 'large_ghg_data.xlsx'
 
-    months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-             'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-
-    # Generate large datasets
-    large_scope1_data = []
-    for i in range(100):  # 100 sources
-        monthly_values = [random.uniform(800, 2500) for _ in months]
-        large_scope1_data.append({
-            'Source': f'Source_{i}',
-            'Annual_Total': sum(monthly_values),
-            'Percentage': random.uniform(0, 10),
-            **dict(zip(months, monthly_values))
-        })
+    # Generate large datasets: 100 sources
+    rng = np.random.default_rng(106)
+    n_sources = 100
+    large_scope1_data = _monthly_frame(rng, 'Source', [f'Source_{i}' for i in range(n_sources)],
+                                       800, 2500,
+                                       Percentage=rng.uniform(0, 10, size=n_sources))
 
     with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-        pd.DataFrame(large_scope1_data).to_excel(writer, sheet_name='Scope 1 Emissions', index=False)
+        large_scope1_data.to_excel(writer, sheet_name='Scope 1 Emissions', index=False)
         # Add minimal other sheets to avoid errors
         pd.DataFrame([{'Source': 'Test', 'Annual_Total': 1000}]).to_excel(writer, sheet_name='Scope 2 Emissions', index=False)
         pd.DataFrame([{'Source': 'Test', 'Annual_Total': 1000}]).to_excel(writer, sheet_name='Scope 3 Emissions', index=False)
@@ -251,7 +240,8 @@ def large_dataset_excel_file(test_data_dir):
 @pytest.fixture(autouse=True)
 def setup_test_environment():
     """Set up test environment before each test"""
-    # Set random seed for reproducible tests
+    # Set random seed for reproducible tests (the source generators
+    # still draw from the stdlib random module)
     random.seed(42)
     np.random.seed(42)
 
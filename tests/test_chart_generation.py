@@ -321,6 +321,14 @@ class TestChartGeneration:
             expected_types = ['bar', 'scatter']
             assert any(trace_type in expected_types for trace_type in trace_types)
 
+    @pytest.mark.unit
+    def test_facility_chart_leaves_data_unchanged(self, report_generator_with_charts):
+        """Test facility breakdown chart does not add columns to the loaded sheet"""
+        columns = list(report_generator_with_charts.data['Facility Breakdown'].columns)
+        report_generator_with_charts.create_facility_breakdown_chart()
+
+        assert list(report_generator_with_charts.data['Facility Breakdown'].columns) == columns
+
     @pytest.mark.unit
     def test_energy_chart_pie_structure(self, report_generator_with_charts):
         """Test energy consumption pie chart structure"""
@@ -7,6 +7,7 @@ ensuring all functionality works correctly and handles edge cases properly.
 
 import pytest
 import pandas as pd
+import io
 import os
 import tempfile
 from pathlib import Path
@@ -37,6 +38,16 @@ class TestGHGExcelGenerator:
         assert generator.company_info['reporting_year'] == 2024
         assert len(generator.company_info['facilities']) == 4
 
+    @pytest.mark.unit
+    def test_initialization_with_company_info(self):
+        """Test that keyword arguments override the default company info"""
+        generator = GHGExcelGenerator(reporting_year=2025, facilities=['Site 1'])
+
+        assert generator.company_info['reporting_year'] == 2025
+        assert generator.company_info['facilities'] == ['Site 1']
+        assert generator.company_info['name'] == 'PetrolCorp International'
+        assert GHGExcelGenerator().company_info['reporting_year'] == 2024
+
     @pytest.mark.unit
     def test_generate_dummy_data_structure(self, generator):
         """Test the structure of generated dummy data"""
@@ -172,6 +183,34 @@ class TestGHGExcelGenerator:
         assert output_file.exists()
         assert output_file.stat().st_size > 0
 
+    @pytest.mark.unit
+    def test_create_excel_template_to_buffer(self, generator):
+        """Test that the template can be written to an in-memory buffer"""
+        buffer = io.BytesIO()
+
+        result = generator.create_excel_template(buffer)
+
+        assert result is buffer
+        wb = openpyxl.load_workbook(io.BytesIO(buffer.getvalue()))
+        assert 'Dashboard' in wb.sheetnames
+        assert wb['Scope 1 Emissions']['A1'].font.bold
+
+    @pytest.mark.unit
+    def test_to_frames_matches_template(self, generator):
+        """Test that to_frames builds the same sheets the template round-trips to"""
+        data = generator.generate_dummy_data()
+        buffer = io.BytesIO()
+        generator._write_template(buffer, data)
+        buffer.seek(0)
+        excel_data = pd.read_excel(buffer, sheet_name=None,
+                                   dtype={'Source': 'string', 'Facility': 'string'})
+
+        frames = generator.to_frames(data)
+
+        assert list(frames) == list(excel_data)
+        for sheet_name, df in frames.items():
+            pd.testing.assert_frame_equal(df, excel_data[sheet_name])
+
     @pytest.mark.unit
     def test_create_excel_template_sheets(self, generator, temp_output_dir):
         """Test that all required Excel sheets are created"""
@@ -7,12 +7,17 @@ testing HTML generation, template rendering, and error handling.
 
 import pytest
 import os
+import sys
 import tempfile
+import threading
+import time
+import types
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import plotly.graph_objects as go
 from jinja2 import Template
 
+import html_report
 from html_report import HTMLReportGenerator
 from report_generator import GHGReportGenerator
 
@@ -516,5 +521,143 @@ class TestHTMLReportGenerator:
                 # If it fails, it should be a handled exception
                 assert "template" in str(e).lower() or "data" in str(e).lower()
 
+
+class TestStaticChartExport:
+    """Tests for the shared Kaleido server used for static chart images"""
+
+    @pytest.fixture
+    def fake_kaleido(self, monkeypatch):
+        """Install a stand-in kaleido module with a live sync server"""
+        kaleido = types.ModuleType('kaleido')
+        kaleido._global_server = Mock()
+        kaleido._global_server._thread.is_alive.return_value = True
+        kaleido.start_sync_server = Mock()
+        kaleido.stop_sync_server = Mock()
+        monkeypatch.setitem(sys.modules, 'kaleido', kaleido)
+        monkeypatch.setattr(html_report, '_kaleido_server_started', False)
+        monkeypatch.setattr(html_report, '_kaleido_server_stopped', False)
+        return kaleido
+
+    @pytest.fixture
+    def fig(self):
+        """Mock figure whose PNG export returns fixed bytes"""
+        fig = Mock()
+        fig.to_image.return_value = b'png'
+        return fig
+
+    @pytest.mark.unit
+    def test_server_started_once(self, fake_kaleido, fig):
+        """Test that the sync server is started after the first export only"""
+        for _ in range(3):
+            assert html_report._fig_to_png(fig, width=100) == b'png'
+
+        fake_kaleido.start_sync_server.assert_called_once_with(silence_warnings=True)
+        fake_kaleido.stop_sync_server.assert_not_called()
+        assert fig.to_image.call_count == 3
+
+    @pytest.mark.unit
+    def test_dead_server_falls_back_to_one_shot(self, fake_kaleido, fig):
+        """Test that a server whose worker died is stopped and not restarted"""
+        html_report._fig_to_png(fig)
+        fake_kaleido._global_server._thread.is_alive.return_value = False
+
+        assert html_report._fig_to_png(fig) == b'png'
+        assert html_report._fig_to_png(fig) == b'png'
+
+        fake_kaleido.stop_sync_server.assert_called_once_with(silence_warnings=True)
+        fake_kaleido.start_sync_server.assert_called_once()
+        assert fig.to_image.call_count == 3
+
+    @pytest.mark.unit
+    def test_unknown_server_internals_treated_as_dead(self, fake_kaleido, fig):
+        """Test that missing Kaleido internals stop the server instead of raising"""
+        html_report._fig_to_png(fig)
+        del fake_kaleido._global_server
+
+        assert html_report._fig_to_png(fig) == b'png'
+        fake_kaleido.stop_sync_server.assert_called_once()
+
+
+class TestHTMLReportRendering:
+    """Rendering tests against a generator loaded from a real workbook"""
+
+    @pytest.fixture
+    def report_generator(self, valid_excel_file):
+        """Create GHGReportGenerator with valid test data"""
+        return GHGReportGenerator(str(valid_excel_file))
+
+    @pytest.mark.unit
+    @patch('html_report.plotly.io.to_html')
+    def test_render_to_string(self, mock_to_html, report_generator):
+        """Test rendering the HTML report without touching the filesystem"""
+        mock_to_html.return_value = '<div>Mock Chart HTML</div>'
+
+        html_content = HTMLReportGenerator(report_generator).render_to_string()
+
+        assert isinstance(html_content, str)
+        assert '<html' in html_content
+        assert 'Mock Chart HTML' in html_content
+
+    @pytest.mark.unit
+    @patch('html_report._fig_to_png', return_value=b'png')
+    @patch('html_report.plotly.io.to_html')
+    def test_chart_cache_reuses_figures(self, mock_to_html, mock_to_png, report_generator):
+        """Test that cache_charts builds the figures once for both render modes"""
+        mock_to_html.return_value = '<div>Mock Chart HTML</div>'
+        html_gen = HTMLReportGenerator(report_generator, cache_charts=True)
+
+        with patch.object(report_generator, 'create_scope_comparison_chart',
+                          wraps=report_generator.create_scope_comparison_chart) as scope_chart:
+            first = html_gen._generate_all_charts()
+            second = html_gen._generate_all_charts()
+            static = html_gen._generate_all_charts(static=True)
+
+        assert first is second
+        assert first['scope_comparison'] == '<div>Mock Chart HTML</div>'
+        assert static['scope_comparison'].startswith('data:image/png;base64,')
+        assert static is html_gen._generate_all_charts(static=True)
+        scope_chart.assert_called_once()
+
+    @pytest.mark.unit
+    def test_chart_cache_skips_failed_images(self, report_generator):
+        """Test that static charts are not cached when an image export fails"""
+        html_gen = HTMLReportGenerator(report_generator, cache_charts=True)
+
+        with patch('html_report._fig_to_png', side_effect=RuntimeError('no browser')):
+            failed = html_gen._generate_all_charts(static=True)
+
+        assert None in failed.values()
+        assert (None, True) not in html_gen._chart_cache
+
+        with patch('html_report._fig_to_png', return_value=b'png'):
+            retried = html_gen._generate_all_charts(static=True)
+
+        assert None not in retried.values()
+        assert html_gen._chart_cache[(None, True)] is retried
+
+    @pytest.mark.unit
+    @patch('html_report._fig_to_png', return_value=b'png')
+    @patch('html_report.plotly.io.to_html', return_value='<div>Mock Chart HTML</div>')
+    def test_chart_cache_builds_figures_once_across_threads(self, mock_to_html, mock_to_png, report_generator):
+        """Test that concurrent HTML and PDF renders share one figure build"""
+        html_gen = HTMLReportGenerator(report_generator, cache_charts=True)
+        build_figures = html_gen._build_figures
+
+        def slow_build(facility_filter=None):
+            time.sleep(0.1)
+            return build_figures(facility_filter)
+
+        with patch.object(html_gen, '_build_figures', side_effect=slow_build) as mock_build:
+            threads = [threading.Thread(target=html_gen._generate_all_charts, kwargs={'static': static})
+                       for static in (False, True)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        mock_build.assert_called_once()
+        assert (None, False) in html_gen._chart_cache
+        assert (None, True) in html_gen._chart_cache
+
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
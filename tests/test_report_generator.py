@@ -8,6 +8,7 @@ testing all chart generation, data processing, and analysis functionality.
 import pytest
 import pandas as pd
 import numpy as np
+import io
 import plotly.graph_objects as go
 from pathlib import Path
 import tempfile
@@ -62,6 +63,32 @@ class TestGHGReportGenerator:
         assert isinstance(generator.data, dict)
         assert generator.report_date is not None
 
+    @pytest.mark.unit
+    def test_initialization_from_buffer(self, valid_excel_file):
+        """Test initialization from an in-memory workbook"""
+        buffer = io.BytesIO(Path(valid_excel_file).read_bytes())
+        generator = GHGReportGenerator(buffer)
+
+        assert generator.data is not None
+        assert 'Scope 1 Emissions' in generator.data
+
+    @pytest.mark.unit
+    def test_from_frames(self, valid_excel_file):
+        """Test building a generator from in-memory sheet DataFrames"""
+        frames = pd.read_excel(valid_excel_file, sheet_name=None)
+        generator = GHGReportGenerator.from_frames(frames)
+
+        assert generator.excel_file is None
+        assert generator.data is frames
+        assert generator.report_date is not None
+
+        # report_date is the construction time, so compare everything else
+        summary = generator.get_summary_statistics()
+        expected = GHGReportGenerator(valid_excel_file).get_summary_statistics()
+        summary.pop('report_date')
+        expected.pop('report_date')
+        assert summary == expected
+
     @pytest.mark.unit
     def test_initialization_invalid_file(self):
         """Test initialization with invalid Excel file"""
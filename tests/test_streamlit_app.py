@@ -0,0 +1,232 @@
+"""
+Unit Tests for the Streamlit App Data Helpers
+
+This module tests the pure data-handling functions in streamlit_app.py
+(source grids, manual input aggregation, manual dataset frames and
+dataset digests)
+without a running Streamlit server.
+"""
+
+import io
+import pytest
+import pandas as pd
+from types import SimpleNamespace
+
+import streamlit_app
+from streamlit_app import (MONTHS, SCOPE_COLUMNS, add_sources_with_data, create_manual_frames,
+                           dataset_digest, generate_data_from_facilities)
+from report_generator import GHGReportGenerator
+
+
+def _facility(name, scope_sources):
+    """Build a facilities_data entry from {scope: [(source, annual_total), ...]}"""
+    sources = {
+        scope: [{
+            'source': source,
+            'annual_total': annual_total,
+            'input_method': 'annual',
+            'monthly_values': dict.fromkeys(MONTHS, annual_total / 12)
+        } for source, annual_total in scope_sources.get(scope, [])]
+        for scope in ('scope1', 'scope2', 'scope3')
+    }
+    totals = {f'{scope}_total': sum(s['annual_total'] for s in sources[scope]) for scope in sources}
+    return {
+        'name': name,
+        'production': 1000.0,
+        'intensity': 0.5,
+        'sources': sources,
+        **totals
+    }
+
+
+class TestManualDataAggregation:
+    """Test suite for generate_data_from_facilities"""
+
+    @pytest.fixture
+    def facilities(self):
+        """Two facilities sharing a Scope 1 source; Scope 3 left empty"""
+        return [
+            _facility('Facility A', {
+                'scope1': [('Flaring', 100.0), ('Combustion - Diesel', 30.0)],
+                'scope2': [('Purchased Electricity', 60.0)]
+            }),
+            _facility('Facility B', {
+                'scope1': [('Flaring', 50.0)],
+                'scope2': [('Purchased Steam', 20.0)]
+            })
+        ]
+
+    @pytest.mark.unit
+    def test_shared_source_is_summed(self, facilities):
+        """Test that a source entered at two facilities is aggregated into one row"""
+        scope1 = generate_data_from_facilities(facilities)['scope1'].set_index('Source')
+
+        assert scope1.index.tolist() == ['Flaring', 'Combustion - Diesel']
+        assert scope1.loc['Flaring', 'Annual_Total'] == pytest.approx(150.0)
+        assert scope1.loc['Flaring', MONTHS].sum() == pytest.approx(150.0)
+        assert scope1.loc['Flaring', 'Jan'] == pytest.approx(150.0 / 12)
+
+    @pytest.mark.unit
+    def test_percentages_sum_to_100_per_scope(self, facilities):
+        """Test that source percentages are computed within each scope"""
+        data = generate_data_from_facilities(facilities)
+
+        for scope in ('scope1', 'scope2'):
+            assert data[scope]['Percentage'].sum() == pytest.approx(100.0)
+        assert data['scope2'].set_index('Source').loc['Purchased Electricity', 'Percentage'] == pytest.approx(75.0)
+
+    @pytest.mark.unit
+    def test_empty_scope_keeps_columns(self, facilities):
+        """Test that a scope without sources is an empty frame with the sheet headers"""
+        scope3 = generate_data_from_facilities(facilities)['scope3']
+
+        assert scope3.empty
+        assert scope3.columns.tolist() == SCOPE_COLUMNS
+
+    @pytest.mark.unit
+    def test_facility_breakdown_and_totals(self, facilities):
+        """Test the per-facility rows and the grand totals"""
+        data = generate_data_from_facilities(facilities)
+
+        assert data['facilities']['Facility'].tolist() == ['Facility A', 'Facility B']
+        assert data['facilities']['Scope_1'].tolist() == [130.0, 50.0]
+        assert data['totals'] == {
+            'scope1_total': 180.0,
+            'scope2_total': 80.0,
+            'scope3_total': 0.0,
+            'grand_total': 260.0
+        }
+
+
+class TestManualFrames:
+    """Test suite for create_manual_frames and dataset_digest"""
+
+    @pytest.fixture
+    def manual_frames(self, monkeypatch):
+        """Manual dataset frames built from a stand-in session state"""
+        monkeypatch.setattr(streamlit_app.st, 'session_state', SimpleNamespace(
+            company_info={
+                'name': 'TestCorp Petroleum',
+                'reporting_year': 2024,
+                'report_date': '2024-05-01',
+                'num_facilities': 2,
+                'company_introduction': 'Refining since 1995.',
+                'conclusion_text': ''
+            },
+            emission_by_source_data=[
+                {'Source': 'Natural Gas', 'Annual_Total_tCO2e': 1200.0, **dict.fromkeys(MONTHS, 100.0)}
+            ]
+        ))
+        facilities = [
+            _facility('Facility A', {'scope1': [('Flaring', 100.0)], 'scope2': [('Purchased Steam', 20.0)]}),
+            _facility('Facility B', {'scope1': [('Flaring', 50.0), ('Process Venting', 25.5)]})
+        ]
+        return create_manual_frames(generate_data_from_facilities(facilities))
+
+    @pytest.mark.unit
+    def test_frames_match_workbook_read_back(self, manual_frames):
+        """Test that the in-memory frames equal what the generator loads from the workbook"""
+        buffer = io.BytesIO()
+        with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
+            for sheet_name, df in manual_frames.items():
+                df.to_excel(writer, sheet_name=sheet_name, index=False)
+        buffer.seek(0)
+
+        loaded = GHGReportGenerator(buffer).data
+
+        assert list(loaded) == list(manual_frames)
+        for sheet_name, df in manual_frames.items():
+            # Excel stores whole floats as ints and empty sheets as object columns
+            pd.testing.assert_frame_equal(df, loaded[sheet_name], check_dtype=False)
+            for label in ('Source', 'Facility'):
+                if label in df.columns and not df.empty:
+                    assert df[label].dtype == loaded[sheet_name][label].dtype
+
+    @pytest.mark.unit
+    def test_digest_changes_with_any_cell(self, manual_frames):
+        """Test that editing any single cell gives a different dataset digest"""
+        original = dataset_digest(manual_frames)
+        assert dataset_digest({name: df.copy() for name, df in manual_frames.items()}) == original
+
+        for sheet_name, df in manual_frames.items():
+            for row in range(len(df)):
+                for col in range(df.shape[1]):
+                    edited = df.copy()
+                    value = edited.iat[row, col]
+                    if pd.api.types.is_numeric_dtype(edited.dtypes.iloc[col]):
+                        edited.iat[row, col] = 1.0 if pd.isna(value) else value + 1
+                    else:
+                        edited.iat[row, col] = f"{value}x"
+
+                    assert dataset_digest({**manual_frames, sheet_name: edited}) != original, \
+                        f"{sheet_name}[{row}, {df.columns[col]}]"
+
+
+class TestSourceGrids:
+    """Test suite for the per-source data_editor grids (source_values_editor)"""
+
+    MONTHLY = "Monthly Values (12 inputs per source)"
+    ANNUAL = "Annual Total (÷12 for monthly)"
+
+    @pytest.fixture
+    def editor(self, monkeypatch):
+        """Stand-in session state and data_editor; cell edits are queued per source"""
+        monkeypatch.setattr(streamlit_app.st, 'session_state', {})
+        editor = SimpleNamespace(inputs=[], edits={})
+
+        def data_editor(data, **kwargs):
+            editor.inputs.append(data)
+            edited = data.copy()
+            for (source, column), value in editor.edits.items():
+                if source in edited.index:
+                    edited.loc[source, column] = value
+            editor.edits = {}
+            return edited
+
+        monkeypatch.setattr(streamlit_app.st, 'data_editor', data_editor)
+        return editor
+
+    def _add_sources(self, monkeypatch, sources, method):
+        """Run add_sources_with_data with the given input method; rows keyed by source"""
+        monkeypatch.setattr(streamlit_app.st, 'radio', lambda *args, **kwargs: method)
+        return {row['source']: row for row in add_sources_with_data(0, 'scope1', sources)}
+
+    @pytest.mark.unit
+    def test_monthly_grid_maps_to_monthly_values(self, monkeypatch, editor):
+        """Test that edited monthly cells become the source's monthly values and total"""
+        editor.edits = {('Flaring', 'Jan'): 10.0, ('Flaring', 'Dec'): None, ('', 'Mar'): 40.0}
+
+        rows = self._add_sources(monkeypatch, ['Flaring', ''], self.MONTHLY)
+
+        assert list(rows) == ['Flaring', '']
+        assert rows['Flaring']['monthly_values'] == {**dict.fromkeys(MONTHS, 85.0), 'Jan': 10.0, 'Dec': 0.0}
+        assert rows['Flaring']['annual_total'] == pytest.approx(85.0 * 10 + 10.0)
+        assert rows['']['monthly_values']['Mar'] == 40.0
+        assert rows['']['annual_total'] == pytest.approx(85.0 * 11 + 40.0)
+        assert all(row['input_method'] == 'monthly' for row in rows.values())
+
+    @pytest.mark.unit
+    def test_annual_grid_splits_evenly(self, monkeypatch, editor):
+        """Test that an annual total is spread as twelve equal monthly values"""
+        editor.edits = {('', 'Annual_Total'): 1200.0}
+
+        rows = self._add_sources(monkeypatch, ['Flaring', ''], self.ANNUAL)
+
+        assert rows['']['annual_total'] == 1200.0
+        assert rows['']['monthly_values'] == dict.fromkeys(MONTHS, 100.0)
+        assert rows['Flaring']['monthly_values'] == dict.fromkeys(MONTHS, 1000.0 / 12)
+
+    @pytest.mark.unit
+    def test_values_follow_source_names(self, monkeypatch, editor):
+        """Test that typed values stay with their source when the source list changes"""
+        editor.edits = {('Flaring', 'Annual_Total'): 500.0, ('', 'Annual_Total'): 70.0}
+        self._add_sources(monkeypatch, ['Flaring', ''], self.ANNUAL)
+
+        rows = self._add_sources(monkeypatch, ['Process Venting', '', 'Flaring'], self.ANNUAL)
+
+        assert editor.inputs[-1]['Annual_Total'].to_dict() == {
+            'Process Venting': 1000.0, '': 70.0, 'Flaring': 500.0
+        }
+        assert {source: row['annual_total'] for source, row in rows.items()} == {
+            'Process Venting': 1000.0, '': 70.0, 'Flaring': 500.0
+        }